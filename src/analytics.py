@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📈 Session Analytics Module
+Loads every session log into columnar NumPy arrays and computes cross-session stats.
+
+Usage: python -m src.analytics [log_dir]
+"""
+
+import argparse
+import logging
+import mmap
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .utils.constants import GRID_SIZE
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ".analytics_cache"  # 🗄️ Parsed columns per session file, inside the log dir
+
+# 🔍 Record patterns for the LogManager text logs (Event/Latency are optional for older sessions)
+_TIMESTAMP = rb"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),(\d{3}) \| \w+ \| "
+_BUTTON_RE = re.compile(
+    _TIMESTAMP + rb"Button Press at \((\d+), (\d+)\)\n"
+    rb"MIDI Note: .*\nMapped Alias: .*\nQuadrant: .*\nColor: .*\n"
+    rb"(?:Event: (\w+)\n)?",
+    re.MULTILINE
+)
+_ALIAS_RE = re.compile(
+    _TIMESTAMP + rb"Alias: (.*?) \| Status: \S+ (SUCCESS|FAILED)(?: \| Latency: ([\d.]+) ms)?$",
+    re.MULTILINE
+)
+
+
+def _read_matches(path: Path, pattern: re.Pattern) -> List[tuple]:
+    """🗺️ Memory-map a log file and return the regex groups of every record"""
+    if path.stat().st_size == 0:
+        return []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return [m.groups() for m in pattern.finditer(data)]
+
+
+def _timestamps(rows: List[tuple]) -> np.ndarray:
+    """⏱️ Vectorized parse of ``(date time, millis)`` pairs into datetime64[ms]"""
+    if not rows:
+        return np.array([], dtype='datetime64[ms]')
+    seconds = np.array([row[0].decode() for row in rows], dtype='datetime64[s]')
+    millis = np.array([int(row[1]) for row in rows], dtype='timedelta64[ms]')
+    return seconds.astype('datetime64[ms]') + millis
+
+
+def parse_button_log(path: Path) -> Dict[str, np.ndarray]:
+    """🎹 Columns for a ``button_mapping_*.log`` file: ts, x, y"""
+    rows = _read_matches(path, _BUTTON_RE)
+    # Older sessions have no Event line; treat their records as presses
+    rows = [row for row in rows if row[4] in (None, b'button_pressed')]
+    return {
+        'ts': _timestamps(rows),
+        'x': np.array([int(row[2]) for row in rows], dtype=np.int16),
+        'y': np.array([int(row[3]) for row in rows], dtype=np.int16),
+    }
+
+
+def parse_alias_log(path: Path) -> Dict[str, np.ndarray]:
+    """🔤 Columns for an ``alias_execution_*.log`` file: ts, alias code, success, latency"""
+    rows = _read_matches(path, _ALIAS_RE)
+    names: Dict[bytes, int] = {}
+    codes = np.array([names.setdefault(row[2], len(names)) for row in rows], dtype=np.int32)
+    return {
+        'ts': _timestamps(rows),
+        'alias': codes,
+        'alias_names': np.array([name.decode(errors='replace') for name in names], dtype=str),
+        'success': np.array([row[3] == b'SUCCESS' for row in rows], dtype=bool),
+        'latency_ms': np.array(
+            [float(row[4]) if row[4] else np.nan for row in rows], dtype=np.float64
+        ),
+    }
+
+
+def load_columns(path: Path, parser, cache_dir: Optional[Path] = None) -> Dict[str, np.ndarray]:
+    """🗄️ Parse a session log, reusing cached columns while the file is unchanged"""
+    stat = path.stat()
+    signature = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = cache_dir / f"{path.stem}.npz"
+        if cache_path.exists():
+            try:
+                with np.load(cache_path) as cached:
+                    if np.array_equal(cached['_signature'], signature):
+                        return {key: cached[key] for key in cached.files if key != '_signature'}
+            except Exception as e:
+                logger.warning(f"⚠️ Ignoring unreadable cache {cache_path}: {e}")
+
+    columns = parser(path)
+    if cache_path is not None:
+        cache_dir.mkdir(exist_ok=True)
+        np.savez(cache_path, _signature=signature, **columns)
+    return columns
+
+
+class SessionAnalytics:
+    """📈 Cross-session analytics over all logs in a directory"""
+
+    def __init__(self, log_dir: str = "logs", use_cache: bool = True):
+        self.log_dir = Path(log_dir)
+        cache_dir = self.log_dir / CACHE_DIR if use_cache else None
+
+        button_files = sorted(self.log_dir.glob("button_mapping_*.log"))
+        alias_files = sorted(self.log_dir.glob("alias_execution_*.log"))
+        self.session_count = len(set(
+            p.stem.split('_', 2)[-1] for p in button_files + alias_files
+        ))
+
+        self.presses = self._concat(
+            [load_columns(p, parse_button_log, cache_dir) for p in button_files]
+        )
+        self.aliases = self._concat_aliases(
+            [load_columns(p, parse_alias_log, cache_dir) for p in alias_files]
+        )
+        logger.info(
+            f"📈 Loaded {self.session_count} sessions: {len(self.presses['ts'])} presses, "
+            f"{len(self.aliases['ts'])} alias executions"
+        )
+
+    @staticmethod
+    def _concat(sessions: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        return {
+            'ts': np.concatenate([s['ts'] for s in sessions] or [np.array([], dtype='datetime64[ms]')]),
+            'x': np.concatenate([s['x'] for s in sessions] or [np.array([], dtype=np.int16)]),
+            'y': np.concatenate([s['y'] for s in sessions] or [np.array([], dtype=np.int16)]),
+        }
+
+    @staticmethod
+    def _concat_aliases(sessions: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """🔗 Merge sessions, remapping per-session alias codes onto one name table"""
+        names: Dict[str, int] = {}
+        codes = []
+        for session in sessions:
+            lookup = np.array(
+                [names.setdefault(str(name), len(names)) for name in session['alias_names']],
+                dtype=np.int32
+            )
+            codes.append(lookup[session['alias']] if len(lookup) else session['alias'])
+
+        return {
+            'ts': np.concatenate([s['ts'] for s in sessions] or [np.array([], dtype='datetime64[ms]')]),
+            'alias': np.concatenate(codes or [np.array([], dtype=np.int32)]),
+            'alias_names': np.array(list(names), dtype=str),
+            'success': np.concatenate([s['success'] for s in sessions] or [np.array([], dtype=bool)]),
+            'latency_ms': np.concatenate([s['latency_ms'] for s in sessions] or [np.array([])]),
+        }
+
+    def pad_heatmap(self) -> np.ndarray:
+        """🌡️ 8x8 press counts indexed ``[y - 1, x - 1]``"""
+        x, y = self.presses['x'], self.presses['y']
+        on_grid = (x >= 1) & (x <= GRID_SIZE) & (y >= 1) & (y <= GRID_SIZE)
+        flat = (y[on_grid] - 1) * GRID_SIZE + (x[on_grid] - 1)
+        return np.bincount(flat, minlength=GRID_SIZE * GRID_SIZE).reshape(GRID_SIZE, GRID_SIZE)
+
+    def alias_success_rates(self) -> List[dict]:
+        """✅ Executions and success rate per alias, most used first"""
+        codes = self.aliases['alias']
+        n = len(self.aliases['alias_names'])
+        totals = np.bincount(codes, minlength=n)
+        successes = np.bincount(codes, weights=self.aliases['success'], minlength=n)
+
+        order = np.argsort(-totals, kind='stable')
+        return [
+            {
+                'alias': str(self.aliases['alias_names'][i]),
+                'executions': int(totals[i]),
+                'success_rate': float(successes[i] / totals[i]) if totals[i] else 0.0,
+            }
+            for i in order
+        ]
+
+    def hourly_usage(self) -> np.ndarray:
+        """🕐 Press counts per hour of day (24 bins)"""
+        ts = self.presses['ts']
+        hours = (ts.astype('datetime64[h]') - ts.astype('datetime64[D]')).astype(np.int64)
+        return np.bincount(hours, minlength=24)
+
+    def latency_trend(self, percentiles=(50, 90, 99)) -> List[dict]:
+        """⏱️ Daily latency percentiles over executions that recorded latency"""
+        latency = self.aliases['latency_ms']
+        known = ~np.isnan(latency)
+        if not known.any():
+            return []
+
+        days = self.aliases['ts'][known].astype('datetime64[D]')
+        values = latency[known]
+        order = np.argsort(days, kind='stable')
+        days, values = days[order], values[order]
+
+        unique_days, starts = np.unique(days, return_index=True)
+        trend = []
+        for day, group in zip(unique_days, np.split(values, starts[1:])):
+            row = {'day': str(day), 'count': int(len(group))}
+            for p, value in zip(percentiles, np.percentile(group, percentiles)):
+                row[f'p{p}'] = float(value)
+            trend.append(row)
+        return trend
+
+
+def main(argv: Optional[List[str]] = None):
+    """🏃 Print a cross-session report"""
+    parser = argparse.ArgumentParser(description="Launchpad session log analytics")
+    parser.add_argument("log_dir", nargs="?", default="logs", help="Directory of session logs")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every session file")
+    args = parser.parse_args(argv)
+
+    analytics = SessionAnalytics(args.log_dir, use_cache=not args.no_cache)
+
+    print(f"\n📈 Sessions: {analytics.session_count}")
+    print(f"   Button Presses: {len(analytics.presses['ts'])}")
+    print(f"   Alias Executions: {len(analytics.aliases['ts'])}")
+
+    print("\n🌡️ Pad Heatmap (top row first):")
+    for row in analytics.pad_heatmap()[::-1]:
+        print("   " + " ".join(f"{count:>6}" for count in row))
+
+    print("\n✅ Alias Success Rates:")
+    for stats in analytics.alias_success_rates():
+        print(f"   • {stats['alias']}: {stats['success_rate']:.1%} of {stats['executions']}")
+
+    print("\n🕐 Usage by Hour:")
+    for hour, count in enumerate(analytics.hourly_usage()):
+        if count:
+            print(f"   {hour:02d}:00  {count}")
+
+    print("\n⏱️ Latency Trend:")
+    for row in analytics.latency_trend():
+        print(
+            f"   {row['day']}: p50 {row['p50']:.0f} ms, p90 {row['p90']:.0f} ms, "
+            f"p99 {row['p99']:.0f} ms (n={row['count']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
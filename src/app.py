@@ -178,11 +178,19 @@ import rtmidi
 import logging
 from typing import Dict, Optional, Callable
 import signal
+import time
 from datetime import datetime
 from .models.button import LaunchpadButton
 from .handlers.alias_handler import AliasHandler
-from .utils.constants import Colors, MIDI_NOTE_ON, calculate_xy
+from .handlers.action_handler import ActionHandler, ActionResult
+from .handlers.midi_process import MidiIOProcess
+from .handlers.gesture_handler import GestureEvent, GestureRecognizer, Gestures
+from .utils.constants import Colors, GRID_SIZE, MIDI_CONTROL_CHANGE, MIDI_NOTE_ON, MIDI_NOTE_OFF, calculate_xy
+from .utils.dashboard import Dashboard, DashboardState
 from .utils.log_manager import LogManager
+from .utils.profiler import RuntimeProfiler
+from .utils.result_cache import CachePolicy
+from .utils.timing_wheel import TimingWheel
 
 logger = logging.getLogger(__name__)
 
@@ -190,26 +198,54 @@ class LaunchpadApp:
     """🎹 Main Launchpad control application"""
     
     def __init__(self, port_name: str = "Launchpad Mini MK3:Launchpad Mini MK3 LPMiniMK3 MI", 
-                 log_manager: Optional[LogManager] = None):
-        self.midi_in = rtmidi.MidiIn()
-        self.midi_out = rtmidi.MidiOut()
+                 log_manager: Optional[LogManager] = None,
+                 isolated_io: bool = False,
+                 dashboard: bool = False,
+                 plugin_dir: Optional[str] = None):
+        # Isolated mode moves MIDI ports into a separate process fed through shared memory
+        self.isolated_io = isolated_io
+        self.midi_process: Optional[MidiIOProcess] = None
+        self.midi_in = None if isolated_io else rtmidi.MidiIn()
+        self.midi_out = None if isolated_io else rtmidi.MidiOut()
         self.port_name = port_name
         self.buttons: Dict[tuple, LaunchpadButton] = {}
+        self.cache_policies: Dict[tuple, CachePolicy] = {}
         self.alias_handler = AliasHandler()
+        # Plugin files are opt-in: only an explicit plugin_dir is ever executed
+        self.action_handler = ActionHandler(self.alias_handler, plugin_dir=plugin_dir)
         self.session_start = datetime.now()
         self._running = False
         
         # Initialize log manager if not provided
         self.log_manager = log_manager or LogManager()
         
+        # Live dashboard replaces per-press debug dumps when enabled
+        self.dashboard_state = DashboardState() if dashboard else None
+        self.dashboard = Dashboard(self.dashboard_state) if dashboard else None
+        
+        # Gesture recognition driven by a single timing wheel thread
+        self.gesture_mappings: Dict[tuple, str] = {}
+        self.gesture_pads: set = set()
+        self.timing_wheel = TimingWheel()
+        self.gesture_recognizer = GestureRecognizer(self._handle_gesture, wheel=self.timing_wheel)
+        
+        # On-demand profiling, also available as the "profile:cpu|memory" action
+        self.profiler = RuntimeProfiler(log_dir=str(self.log_manager.log_dir))
+        self.action_handler.register("profile", self.profiler.handle_action)
+        
         # Set up signal handlers
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
+        signal.signal(signal.SIGUSR1, self.profiler.toggle_cpu)
+        signal.signal(signal.SIGUSR2, self.profiler.toggle_memory)
         
         logger.info("🚀 Initializing LaunchpadApp")
         
     def connect(self) -> bool:
         """🔌 Connect to Launchpad MIDI ports"""
+        if self.isolated_io:
+            return self._connect_isolated()
+            
         try:
             # List available ports
             in_ports = self.midi_in.get_ports()
@@ -236,11 +272,41 @@ class LaunchpadApp:
             logger.error(f"❌ Failed to connect to Launchpad: {e}")
             return False
             
-    def add_mapping(self, x: int, y: int, color: int, alias: str):
-        """🎯 Map button to alias with color"""
+    def _connect_isolated(self) -> bool:
+        """🛰️ Start the MIDI I/O process and route LED output through it"""
+        try:
+            self.midi_process = MidiIOProcess(self.port_name, self._handle_midi_message)
+            self.midi_process.start()
+            self.midi_out = self.midi_process
+            
+            # Re-send colors for mappings made before the ports were open
+            for button in self.buttons.values():
+                self.set_button_color(button)
+                
+            logger.info(f"✅ Connected to Launchpad (isolated I/O): {self.port_name}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to connect to Launchpad: {e}")
+            return False
+            
+    def add_mapping(self, x: int, y: int, color: int, alias: str,
+                    cache_ttl: Optional[float] = None, stale_ttl: float = 0.0,
+                    cache_env: tuple = ()):
+        """🎯 Map button to alias with color
+
+        Set ``cache_ttl`` for read-only aliases to reuse results across presses.
+        """
         button = LaunchpadButton(x=x, y=y, color=color, alias=alias)
         self.buttons[(x, y)] = button
         
+        if cache_ttl is not None:
+            self.cache_policies[(x, y)] = CachePolicy(
+                ttl=cache_ttl, stale_ttl=stale_ttl, env=tuple(cache_env)
+            )
+        else:
+            self.cache_policies.pop((x, y), None)
+        
         # Set initial button color
         self.set_button_color(button)
         
@@ -263,8 +329,44 @@ class LaunchpadApp:
             f"   MIDI Note: {button.note}"
         )
         
+    def add_gesture_mapping(self, gesture: str, pads: list, alias: str):
+        """✋ Map a gesture on one or more pads to an alias
+
+        A pad with any gesture mapping runs its plain alias on the resolved tap
+        instead of on press, so each gesture triggers only its own action.
+        Unknown gestures and pads off the device raise ``ValueError``.
+        """
+        if gesture not in Gestures.ALL:
+            raise ValueError(f"Unknown gesture '{gesture}', expected one of {sorted(Gestures.ALL)}")
+            
+        pads = frozenset(tuple(pad) for pad in pads)
+        # The 8x8 grid plus the side column and top row (CC buttons), all fed to the recognizer
+        off_device = [pad for pad in pads if not all(1 <= v <= GRID_SIZE + 1 for v in pad)]
+        if not pads or off_device:
+            raise ValueError(f"Gesture pads must be on the device: {sorted(off_device) or 'none given'}")
+            
+        if gesture == Gestures.CHORD:
+            self.gesture_recognizer.register_chord(pads)
+        elif len(pads) != 1:
+            raise ValueError(f"Gesture '{gesture}' takes exactly one pad")
+        elif gesture == Gestures.DOUBLE_TAP:
+            self.gesture_recognizer.register_double_tap(next(iter(pads)))
+            
+        self.gesture_mappings[(gesture, pads)] = alias
+        self.gesture_pads.update(pads)
+        
+        logger.info(
+            f"✨ Mapped gesture:\n"
+            f"   Gesture: {gesture}\n"
+            f"   Pads: {sorted(pads)}\n"
+            f"   Alias: {alias}"
+        )
+        
     def set_button_color(self, button: LaunchpadButton):
         """🎨 Set button color"""
+        if self.midi_out is None:
+            return
+            
         try:
             message = [MIDI_NOTE_ON, button.note, button.color]
             self.midi_out.send_message(message)
@@ -275,18 +377,34 @@ class LaunchpadApp:
     def _handle_midi_input(self, event, _):
         """🎯 Process incoming MIDI messages"""
         message, _ = event
+        self._handle_midi_message(message, time.monotonic())
         
+    def _handle_midi_message(self, message: list, timestamp: float):
+        """🎯 Process a MIDI message received at ``timestamp`` (monotonic seconds)"""
         if len(message) != 3:
             return
             
         status, note, velocity = message
         x, y = calculate_xy(note)
         
+        # Feed gesture recognition: grid pads send notes, top row/side buttons send CC
+        # (note-off or zero velocity/value is a release)
+        kind = status & 0xF0
+        if kind in (MIDI_NOTE_ON, MIDI_CONTROL_CHANGE):
+            if velocity > 0:
+                self.gesture_recognizer.press((x, y), timestamp)
+            else:
+                self.gesture_recognizer.release((x, y), timestamp)
+        elif kind == MIDI_NOTE_OFF:
+            self.gesture_recognizer.release((x, y), timestamp)
+        
         # Get button if it exists
         button = self.buttons.get((x, y))
         
         if button and velocity > 0:  # Button press
             button.record_press(velocity)
+            if self.dashboard_state:
+                self.dashboard_state.record_press(x, y)
             
             # Log button press
             self.log_manager.log_button_press({
@@ -300,31 +418,77 @@ class LaunchpadApp:
                 'event_type': 'button_pressed'
             })
             
-            # Execute alias if defined
-            if button.alias:
-                success = self.alias_handler.execute(button.alias)
-                
-                # Log alias execution
-                self.log_manager.log_alias_execution(
-                    alias=button.alias,
-                    success=success,
-                    output=f"Button pressed at ({x}, {y})",
-                    error=None if success else "Execution failed"
-                )
-                
-                logger.info(
-                    f"{'✅' if success else '❌'} "
-                    f"Alias execution: {button.alias}"
+            # Execute alias if defined; gesture pads wait for the recognizer's tap
+            if button.alias and (x, y) not in self.gesture_pads:
+                self._dispatch_action(
+                    button.alias, timestamp, "Alias", cache=self.cache_policies.get((x, y))
                 )
                 
             # Print debug info
-            logger.info(button.get_debug_info())
+            if not self.dashboard:
+                logger.info(button.get_debug_info())
+            
+    def _handle_gesture(self, event: GestureEvent):
+        """✋ Dispatch the alias mapped to a recognized gesture"""
+        alias = self.gesture_mappings.get((event.gesture, event.pads))
+        cache = None
+        
+        # Plain aliases on gesture pads were held back until the press resolved to a tap
+        if alias is None and event.gesture == Gestures.TAP:
+            pad = next(iter(event.pads))
+            button = self.buttons.get(pad)
+            if pad in self.gesture_pads and button and button.alias:
+                alias, cache = button.alias, self.cache_policies.get(pad)
+                
+        if alias:
+            self._dispatch_action(alias, event.timestamp, f"Gesture {event.gesture}", cache=cache)
             
+    def _dispatch_action(self, action: str, timestamp: float, source: str,
+                         cache: Optional[CachePolicy] = None):
+        """🚀 Hand an action to the dispatch workers; it is logged when it finishes"""
+        job_id = self.dashboard_state.job_started(action, timestamp) if self.dashboard_state else None
+        try:
+            self.action_handler.submit(
+                action, cache=cache,
+                callback=lambda result: self._on_action_done(action, result, timestamp, source, job_id)
+            )
+        except Exception as e:
+            logger.error(f"❌ Failed to dispatch {action}: {e}")
+            self._on_action_done(action, ActionResult(success=False, error=str(e)), timestamp, source, job_id)
+            
+    def _on_action_done(self, action: str, result: ActionResult, timestamp: float,
+                        source: str, job_id: Optional[int]):
+        """📝 Record a finished action in the logs and on the dashboard"""
+        if job_id is not None:
+            self.dashboard_state.job_finished(job_id, result.success)
+            
+        # Log alias execution
+        self.log_manager.log_alias_execution(
+            alias=action,
+            success=result.success,
+            output=result.output,
+            error=result.error,
+            latency_ms=(time.monotonic() - timestamp) * 1000
+        )
+        
+        logger.info(
+            f"{'✅' if result.success else '❌'} "
+            f"{source} execution{' (cached)' if result.cached else ''}: {action}"
+        )
+        
     def _handle_shutdown(self, *args):
         """🔄 Clean shutdown handling"""
         logger.info("🛑 Shutting down...")
         
         try:
+            # Restore the terminal before printing the summary
+            if self.dashboard:
+                self.dashboard.stop()
+                
+            # Stop gesture timeouts before the ports go away
+            self.timing_wheel.stop()
+            self.action_handler.shutdown()
+            
             # Turn off all mapped buttons
             for button in self.buttons.values():
                 self.set_button_color(LaunchpadButton(
@@ -334,8 +498,11 @@ class LaunchpadApp:
                 ))
                 
             # Close MIDI ports
-            self.midi_in.close_port()
-            self.midi_out.close_port()
+            if self.midi_process:
+                self.midi_process.stop()
+            else:
+                self.midi_in.close_port()
+                self.midi_out.close_port()
             
             # Get final session summary
             summary = self.log_manager.get_session_summary()
@@ -359,6 +526,9 @@ class LaunchpadApp:
             return
             
         self._running = True
+        self.timing_wheel.start()
+        if self.dashboard:
+            self.dashboard.start()
         logger.info("✨ Application started - Press Ctrl+C to exit")
         
         try:
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧩 Action Handler Module
+Dispatches pad actions to in-process plugins, with shell aliases as one action type.
+"""
+
+import importlib.util
+import logging
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from datetime import datetime
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .alias_handler import AliasHandler
+from ..plugins import builtin
+from ..utils.result_cache import CachePolicy, ResultCache
+from ..utils.worker_pool import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "launchpad.actions"  # 📦 Entry point group for installed plugins
+SHELL_ACTION = "shell"                   # 🐚 Action type for plain shell aliases
+SHELL_TIMEOUT = 5.0                      # ⏰ Seconds before a shell alias is killed
+RESULT_GRACE = 0.1                       # ⏳ Extra wait for plugins reporting their own timeout
+
+
+@dataclass(frozen=True)
+class ActionResult:
+    """📦 Outcome of an action, as returned to logging and feedback"""
+    success: bool
+    output: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+    @classmethod
+    def from_value(cls, value: Any) -> 'ActionResult':
+        """🔄 Plugins may return an ``ActionResult`` or anything truthy/falsy"""
+        return value if isinstance(value, cls) else cls(success=bool(value))
+
+
+class ActionHandler:
+    """🧩 Runs pad actions on a pool of dispatch workers with timeouts
+
+    An action string is ``"<type>:<argument>"`` when ``<type>`` is a registered action,
+    otherwise the whole string is run as a shell alias.
+
+    Plugins are called as ``func(argument, deadline)`` where ``deadline`` is a
+    ``time.monotonic()`` timestamp they must return by. A plugin that overruns is
+    abandoned and its worker replaced; see ``WorkerPool``.
+
+    Plugin files are only loaded from ``plugin_dir`` when one is given explicitly;
+    installed packages can always register actions through entry points.
+    """
+
+    def __init__(self, alias_handler: Optional[AliasHandler] = None,
+                 plugin_dir: Optional[str] = None,
+                 max_workers: int = 4,
+                 dispatch_workers: int = 4,
+                 default_timeout: float = 2.0):
+        self.alias_handler = alias_handler or AliasHandler()
+        self.default_timeout = default_timeout
+        self.actions: Dict[str, Tuple[Callable[[str, float], Any], float]] = {}
+        self.execution_history = []
+        self.result_cache = ResultCache()
+        self._workers = WorkerPool(max_workers, name="action")
+        # Callers hand actions off here; execute() is bounded by the action deadlines
+        self._dispatch = WorkerPool(dispatch_workers, name="dispatch")
+
+        self.register(SHELL_ACTION, self._run_shell, timeout=SHELL_TIMEOUT)
+        for name, func in builtin.ACTIONS.items():
+            self.register(name, func)
+
+        self._load_entry_points()
+        if plugin_dir:
+            self._load_plugin_dir(Path(plugin_dir).expanduser().resolve())
+
+        logger.info(f"🧩 Initialized ActionHandler with actions: {sorted(self.actions)}")
+
+    def register(self, name: str, func: Callable[[str, float], Any], timeout: Optional[float] = None):
+        """➕ Register an action type; ``timeout=None`` uses the default timeout"""
+        if timeout is None:
+            timeout = self.default_timeout
+        if name in self.actions:
+            logger.warning(f"⚠️ Replacing action type: {name}")
+        self.actions[name] = (func, timeout)
+
+    def resolve(self, action: str) -> Tuple[str, str]:
+        """🔎 Split an action string into ``(type, argument)``"""
+        name, sep, argument = action.partition(':')
+        if sep and name in self.actions:
+            return name, argument
+        return SHELL_ACTION, action
+
+    def execute(self, action: str, cache: Optional[CachePolicy] = None) -> ActionResult:
+        """
+        🎯 Execute an action, blocking until it finishes
+
+        Args:
+            action: Action string, or a plain shell alias name
+            cache: Optional caching rules for idempotent (read-only) actions
+        """
+        name, argument = self.resolve(action)
+        if cache:
+            try:
+                result, cached = self.result_cache.get_or_run(
+                    cache.key(action), cache, lambda: self._run_safely(name, argument),
+                    cacheable=self._cacheable(cache)
+                )
+                result = self._mark_cached(result, cached, name, argument)
+            except Exception as e:
+                # Only reachable when a joined run was abandoned, e.g. cancelled at shutdown
+                logger.error(f"💥 Error executing {name} action {argument}: {e}")
+                result = ActionResult(success=False, error=str(e) or type(e).__name__)
+        else:
+            result = self._run_safely(name, argument)
+
+        self._record(action, name, result)
+        return result
+
+    def submit(self, action: str, cache: Optional[CachePolicy] = None,
+               callback: Optional[Callable[[ActionResult], None]] = None) -> Future:
+        """🚀 Execute an action without blocking the caller; ``callback(result)`` runs when done
+
+        With ``cache``, hits and joins on an in-flight run never take a dispatch
+        worker: a hit completes (and calls back) immediately on the caller's thread,
+        a join completes when the run it joined does.
+        """
+        if not cache:
+            return self._dispatch.submit(self._execute_and_notify, action, None, callback)
+
+        name, argument = self.resolve(action)
+        source, cached = self.result_cache.get_or_submit(
+            cache.key(action), cache, lambda: self._run_safely(name, argument),
+            self._dispatch.submit, cacheable=self._cacheable(cache)
+        )
+        done = Future()
+
+        def finish(source: Future):
+            try:
+                result = self._mark_cached(source.result(), cached, name, argument)
+            except BaseException as e:
+                result = ActionResult(success=False, error=str(e) or type(e).__name__)
+            self._record(action, name, result)
+            done.set_result(result)
+            self._notify(action, result, callback)
+
+        source.add_done_callback(finish)
+        return done
+
+    def _execute_and_notify(self, action: str, cache: Optional[CachePolicy],
+                            callback: Optional[Callable[[ActionResult], None]]) -> ActionResult:
+        result = self.execute(action, cache=cache)
+        self._notify(action, result, callback)
+        return result
+
+    def _notify(self, action: str, result: ActionResult,
+                callback: Optional[Callable[[ActionResult], None]]):
+        if callback:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"❌ Action callback failed for {action}: {e}")
+
+    def _record(self, action: str, name: str, result: ActionResult):
+        """📝 Append an action outcome to the execution history"""
+        self.execution_history.append({
+            'action': action,
+            'type': name,
+            'timestamp': datetime.now(),
+            'success': result.success,
+            'cached': result.cached,
+            'output': result.output,
+            'error': result.error
+        })
+
+    @staticmethod
+    def _cacheable(cache: CachePolicy) -> Callable[[ActionResult], bool]:
+        return lambda result: result.success or cache.cache_failures
+
+    @staticmethod
+    def _mark_cached(result: ActionResult, cached: bool, name: str, argument: str) -> ActionResult:
+        if not cached:
+            return result
+        logger.info(f"🗄️ Cached result for {name} action: {argument}")
+        return replace(result, cached=True)
+
+    def _run_safely(self, name: str, argument: str) -> ActionResult:
+        """🛡️ ``_run`` with timeouts and errors turned into failed results"""
+        try:
+            return self._run(name, argument)
+
+        except FutureTimeoutError:
+            logger.error(f"⏰ Timeout executing {name} action: {argument}")
+            return ActionResult(success=False, error="Execution timeout")
+
+        except Exception as e:
+            logger.error(f"💥 Error executing {name} action {argument}: {e}")
+            return ActionResult(success=False, error=str(e))
+
+    def _run(self, name: str, argument: str) -> ActionResult:
+        """⚙️ Run an action on a worker, raising on timeout or error"""
+        func, timeout = self.actions[name]
+        logger.info(f"🔄 Executing {name} action: {argument}")
+        future = self._workers.submit(func, argument, time.monotonic() + timeout)
+        try:
+            return ActionResult.from_value(future.result(timeout=timeout + RESULT_GRACE))
+        except FutureTimeoutError:
+            self._workers.abandon(future)
+            raise
+
+    def _run_shell(self, alias: str, deadline: float) -> ActionResult:
+        """🐚 Shell action: run the alias, killing it at the deadline"""
+        record = self.alias_handler.run(alias, timeout=max(0.0, deadline - time.monotonic()))
+        return ActionResult(record['success'], record['output'], record['error'])
+
+    def shutdown(self):
+        """🛑 Stop the dispatch workers without waiting on stuck actions"""
+        self._dispatch.shutdown()
+        self._workers.shutdown()
+
+    def _load_entry_points(self):
+        """📦 Register actions exposed by installed packages"""
+        try:
+            discovered = entry_points(group=ENTRY_POINT_GROUP)
+        except Exception as e:
+            logger.error(f"❌ Failed to read entry points: {e}")
+            return
+
+        for ep in discovered:
+            try:
+                self.register(ep.name, ep.load())
+                logger.info(f"📦 Loaded action plugin: {ep.name} ({ep.value})")
+            except Exception as e:
+                logger.error(f"❌ Failed to load action plugin {ep.name}: {e}")
+
+    def _load_plugin_dir(self, plugin_dir: Path):
+        """📂 Register actions from ``*.py`` files exposing an ``ACTIONS`` dict"""
+        if not plugin_dir.is_dir():
+            logger.warning(f"⚠️ Plugin directory not found: {plugin_dir}")
+            return
+
+        logger.info(f"📂 Loading action plugins from {plugin_dir}")
+
+        for path in sorted(plugin_dir.glob("*.py")):
+            try:
+                spec = importlib.util.spec_from_file_location(f"launchpad_plugin_{path.stem}", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+
+                for name, func in getattr(module, 'ACTIONS', {}).items():
+                    self.register(name, func)
+                    logger.info(f"📂 Loaded action plugin: {name} ({path.name})")
+
+            except Exception as e:
+                logger.error(f"❌ Failed to load plugin file {path}: {e}")
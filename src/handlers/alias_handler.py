@@ -10,6 +10,7 @@ import subprocess
 import logging
 from pathlib import Path
 import os
+import signal
 from typing import Optional
 from datetime import datetime
 
@@ -24,12 +25,20 @@ class AliasHandler:
         self.execution_history = []
         logger.info(f"🚀 Initialized AliasHandler with shell: {shell_path}")
         
-    def execute(self, alias_name: str) -> bool:
+    def execute(self, alias_name: str, timeout: float = 5) -> bool:
+        """🎯 Execute a shell alias, returning whether it succeeded"""
+        return self.run(alias_name, timeout)['success']
+        
+    def run(self, alias_name: str, timeout: float = 5) -> dict:
         """
         🎯 Execute a shell alias with comprehensive logging
         
         Args:
             alias_name: Name of the alias to execute
+            timeout: Seconds before the alias is killed
+            
+        Returns:
+            The execution record, including output and error
         """
         timestamp = datetime.now()
         execution_record = {
@@ -40,6 +49,7 @@ class AliasHandler:
             'error': None
         }
         
+        process = None
         try:
             # Using the successful method from previous implementation
             command = f"{self.shell_path} -i -c '{alias_name}'"
@@ -57,7 +67,7 @@ class AliasHandler:
                 start_new_session=True
             )
             
-            stdout, stderr = process.communicate(timeout=5)
+            stdout, stderr = process.communicate(timeout=timeout)
             
             # Record outputs
             if stdout:
@@ -83,6 +93,13 @@ class AliasHandler:
             execution_record['error'] = "Execution timeout"
             success = False
             
+            # Don't leave the alias running in its own session
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.communicate()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to kill timed out alias {alias_name}: {e}")
+            
         except Exception as e:
             logger.error(f"💥 Error executing {alias_name}: {e}")
             execution_record['error'] = str(e)
@@ -90,7 +107,7 @@ class AliasHandler:
             
         finally:
             self.execution_history.append(execution_record)
-            return success
+            return execution_record
     
     def get_execution_stats(self) -> dict:
         """📊 Get statistics about alias executions"""
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+✋ Gesture Handler Module
+Recognizes long-presses, double-taps and multi-pad chords from pad events.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..utils.timing_wheel import Timeout, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+Pad = Tuple[int, int]
+
+
+class Gestures:
+    """✋ Supported gesture types"""
+    TAP = "tap"                # 👆 Press and release that became no other gesture
+    LONG_PRESS = "long_press"  # ⏳ Held past the long-press threshold
+    DOUBLE_TAP = "double_tap"  # ✌️ Two releases within the double-tap window (registered pads)
+    CHORD = "chord"            # 🎹 Registered pad set pressed together
+
+    ALL = frozenset({TAP, LONG_PRESS, DOUBLE_TAP, CHORD})
+
+
+@dataclass(frozen=True)
+class GestureEvent:
+    """📍 A recognized gesture"""
+    gesture: str
+    pads: FrozenSet[Pad]
+    timestamp: float
+
+
+class GestureRecognizer:
+    """🧠 Turns timestamped press/release events into gestures
+
+    All timing decisions use the timestamps passed to ``press``/``release``/``advance``,
+    so feeding the same event sequence always yields the same gestures.
+
+    Every press resolves to exactly one of TAP, LONG_PRESS or CHORD (or DOUBLE_TAP
+    together with the press before it). TAP fires on release, except on pads
+    registered for double-tap, where it waits out the double-tap window first.
+    """
+
+    def __init__(self, on_gesture: Callable[[GestureEvent], None],
+                 wheel: Optional[TimingWheel] = None,
+                 long_press_ms: int = 600,
+                 double_tap_ms: int = 300,
+                 chord_window_ms: int = 80):
+        self.on_gesture = on_gesture
+        self.wheel = wheel or TimingWheel()
+        self.long_press = long_press_ms / 1000
+        self.double_tap = double_tap_ms / 1000
+        self.chord_window = chord_window_ms / 1000
+        self.chords: Set[FrozenSet[Pad]] = set()
+        self.double_tap_pads: Set[Pad] = set()
+
+        self._held: Dict[Pad, float] = {}
+        self._hold_timeouts: Dict[Pad, Timeout] = {}
+        self._consumed: Set[Pad] = set()
+        self._pending_taps: Dict[Pad, Tuple[Timeout, float]] = {}
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"✋ GestureRecognizer ready: long_press={long_press_ms}ms, "
+            f"double_tap={double_tap_ms}ms, chord_window={chord_window_ms}ms"
+        )
+
+    def register_chord(self, pads: Iterable[Pad]):
+        """🎹 Register a set of pads to be recognized as a chord"""
+        chord = frozenset(pads)
+        if len(chord) < 2:
+            raise ValueError("A chord needs at least two pads")
+        self.chords.add(chord)
+
+    def register_double_tap(self, pad: Pad):
+        """✌️ Hold back taps on ``pad`` for the double-tap window to detect double-taps"""
+        self.double_tap_pads.add(pad)
+
+    def press(self, pad: Pad, timestamp: Optional[float] = None):
+        """⬇️ Handle a pad press"""
+        timestamp = self._now(timestamp)
+        self.wheel.advance(timestamp)
+
+        events = []
+        with self._lock:
+            self._held[pad] = timestamp
+            self._consumed.discard(pad)
+            self._hold_timeouts[pad] = self.wheel.schedule(
+                self.long_press, self._on_hold_timeout, pad, timestamp, now=timestamp
+            )
+
+            if self.chords:
+                recent = frozenset(
+                    p for p, pressed_at in self._held.items()
+                    if p not in self._consumed and timestamp - pressed_at <= self.chord_window
+                )
+                if recent in self.chords:
+                    for p in recent:
+                        self._consume(p)
+                    events.append(GestureEvent(Gestures.CHORD, recent, timestamp))
+
+        self._emit(events)
+
+    def release(self, pad: Pad, timestamp: Optional[float] = None):
+        """⬆️ Handle a pad release"""
+        timestamp = self._now(timestamp)
+        self.wheel.advance(timestamp)
+
+        events = []
+        with self._lock:
+            if self._held.pop(pad, None) is None:
+                return
+
+            timeout = self._hold_timeouts.pop(pad, None)
+            if timeout:
+                timeout.cancel()
+
+            if pad in self._consumed:
+                self._consumed.discard(pad)
+                return
+
+            pads = frozenset([pad])
+            if pad not in self.double_tap_pads:
+                events.append(GestureEvent(Gestures.TAP, pads, timestamp))
+            else:
+                pending = self._pending_taps.pop(pad, None)
+                if pending and pending[0].cancel():
+                    events.append(GestureEvent(Gestures.DOUBLE_TAP, pads, timestamp))
+                else:
+                    if pending:
+                        # The first tap's timeout fired but lost the race for the lock
+                        events.append(GestureEvent(Gestures.TAP, pads, pending[1] + self.double_tap))
+                    timeout = self.wheel.schedule(
+                        self.double_tap, self._on_tap_timeout, pad, timestamp, now=timestamp
+                    )
+                    self._pending_taps[pad] = (timeout, timestamp)
+
+        self._emit(events)
+
+    def advance(self, timestamp: Optional[float] = None):
+        """⏩ Let pending long-press and tap timeouts fire up to ``timestamp``"""
+        self.wheel.advance(self._now(timestamp))
+
+    def replay(self, events: Iterable[Tuple[float, Pad, bool]],
+               until: Optional[float] = None) -> List[GestureEvent]:
+        """🔁 Feed ``(timestamp, pad, pressed)`` events and return the gestures recognized
+
+        Use a recognizer whose wheel is not being driven by its own thread.
+        """
+        captured: List[GestureEvent] = []
+        previous = self.on_gesture
+        self.on_gesture = captured.append
+        try:
+            last = None
+            for timestamp, pad, pressed in events:
+                if pressed:
+                    self.press(pad, timestamp)
+                else:
+                    self.release(pad, timestamp)
+                last = timestamp
+            if until is not None or last is not None:
+                self.advance(until if until is not None else last)
+        finally:
+            self.on_gesture = previous
+        return captured
+
+    def _on_hold_timeout(self, pad: Pad, pressed_at: float):
+        """⏳ Long-press timeout fired by the wheel"""
+        with self._lock:
+            if self._held.get(pad) != pressed_at or pad in self._consumed:
+                return
+            self._hold_timeouts.pop(pad, None)
+            self._consumed.add(pad)
+            event = GestureEvent(Gestures.LONG_PRESS, frozenset([pad]), pressed_at + self.long_press)
+
+        self._emit([event])
+
+    def _on_tap_timeout(self, pad: Pad, released_at: float):
+        """👆 No second tap arrived within the double-tap window"""
+        with self._lock:
+            pending = self._pending_taps.get(pad)
+            if pending is None or pending[1] != released_at:
+                return
+            del self._pending_taps[pad]
+            event = GestureEvent(Gestures.TAP, frozenset([pad]), released_at + self.double_tap)
+
+        self._emit([event])
+
+    def _consume(self, pad: Pad):
+        """🧹 Mark a held pad as used by a gesture so it yields nothing else"""
+        self._consumed.add(pad)
+        timeout = self._hold_timeouts.pop(pad, None)
+        if timeout:
+            timeout.cancel()
+
+    def _emit(self, events: List[GestureEvent]):
+        for event in events:
+            logger.debug(f"✋ Gesture: {event.gesture} on {sorted(event.pads)}")
+            try:
+                self.on_gesture(event)
+            except Exception as e:
+                logger.error(f"❌ Gesture callback failed: {e}")
+
+    def _now(self, timestamp: Optional[float]) -> float:
+        return self.wheel.clock() if timestamp is None else timestamp
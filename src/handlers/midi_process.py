@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🛰️ MIDI Process Module
+Runs MIDI input/output in a dedicated process so main-process work never delays it.
+"""
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from typing import Callable, List, Optional
+
+from ..utils.shm_ring import SharedRing
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 0.5  # ⏱️ Longest a ring consumer sleeps without a wake-up before re-checking stop
+
+
+def _io_main(port_name: str, input_ring_name: str, output_ring_name: str,
+             input_wakeup, output_wakeup, stop_event, status_conn):
+    """🛰️ Entry point of the I/O process: owns MidiIn/MidiOut and the ring endpoints"""
+    # Ctrl+C reaches the whole process group; only the parent's stop event ends us,
+    # so the LED-off frames queued during its shutdown still get sent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    import rtmidi
+
+    input_ring = SharedRing(input_ring_name, wakeup=input_wakeup)
+    output_ring = SharedRing(output_ring_name, wakeup=output_wakeup)
+    midi_in = rtmidi.MidiIn()
+    midi_out = rtmidi.MidiOut()
+
+    try:
+        in_port_idx = next(i for i, name in enumerate(midi_in.get_ports()) if port_name in name)
+        out_port_idx = next(i for i, name in enumerate(midi_out.get_ports()) if port_name in name)
+        midi_in.open_port(in_port_idx)
+        midi_out.open_port(out_port_idx)
+    except StopIteration:
+        status_conn.send(f"Port not found: {port_name}")
+        return
+    except Exception as e:
+        status_conn.send(str(e))
+        return
+
+    def on_input(event, _):
+        # Timestamp on arrival, before anything else can delay it
+        message, _ = event
+        if 0 < len(message) <= input_ring.max_message:
+            input_ring.push(time.monotonic(), message)
+
+    midi_in.set_callback(on_input)
+    status_conn.send(None)
+
+    try:
+        while not stop_event.is_set():
+            frames = output_ring.drain()
+            for _, message in frames:
+                midi_out.send_message(message)
+            if not frames:
+                output_ring.wait(IDLE_TIMEOUT)
+    finally:
+        # Flush frames queued right before shutdown (e.g. turning LEDs off)
+        for _, message in output_ring.drain():
+            midi_out.send_message(message)
+        midi_in.cancel_callback()
+        midi_in.close_port()
+        midi_out.close_port()
+        input_ring.close()
+        output_ring.close()
+
+
+class MidiIOProcess:
+    """🛰️ Main-process side of the isolated MIDI I/O process"""
+
+    def __init__(self, port_name: str, on_message: Callable[[List[int], float], None],
+                 capacity: int = 1024):
+        self.port_name = port_name
+        self.on_message = on_message
+        self.capacity = capacity
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._reader: Optional[threading.Thread] = None
+        self._stop = None
+        self.input_ring: Optional[SharedRing] = None
+        self.output_ring: Optional[SharedRing] = None
+        self._rings_lock = threading.Lock()
+
+    def start(self, timeout: float = 10.0):
+        """▶️ Spawn the I/O process and wait until its ports are open"""
+        # Each ring carries a semaphore so its consumer sleeps until there is work
+        self.input_ring = SharedRing(capacity=self.capacity, wakeup=self._context.Semaphore(0))
+        self.output_ring = SharedRing(capacity=self.capacity, wakeup=self._context.Semaphore(0))
+        self._stop = self._context.Event()
+        parent_conn, child_conn = self._context.Pipe(duplex=False)
+
+        self._process = self._context.Process(
+            target=_io_main,
+            args=(self.port_name, self.input_ring.name, self.output_ring.name,
+                  self.input_ring.wakeup, self.output_ring.wakeup, self._stop, child_conn),
+            name="midi-io",
+            daemon=True
+        )
+        self._process.start()
+
+        error = parent_conn.recv() if parent_conn.poll(timeout) else "I/O process did not start"
+        if error:
+            self.stop()
+            raise ConnectionError(error)
+
+        self._reader = threading.Thread(target=self._read_loop, name="midi-io-reader", daemon=True)
+        self._reader.start()
+        logger.info(f"🛰️ MIDI I/O process running (pid {self._process.pid})")
+
+    def send_message(self, message: List[int]):
+        """📤 Queue an outgoing message (LED frame, SysEx) for the I/O process
+
+        Raises ``ValueError`` for messages the ring cannot carry unchanged.
+        """
+        if not self.output_ring.push(time.monotonic(), message):
+            logger.warning(f"⚠️ Output ring full, dropped message: {message}")
+
+    def stop(self):
+        """⏹️ Stop the I/O process and free the rings"""
+        if self._stop is not None:
+            self._stop.set()
+            # Wake both consumers so they see the stop request right away
+            for ring in (self.input_ring, self.output_ring):
+                if ring is not None:
+                    ring.notify()
+        if self._process is not None:
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        if self._reader is not None:
+            # The reader releases the rings itself once it is out of the handler
+            self._reader.join(timeout=1)
+            if self._reader.is_alive():
+                logger.warning("⚠️ MIDI reader still busy; rings will be freed when it returns")
+            self._reader = None
+        else:
+            self._close_rings()
+        logger.info("🛰️ MIDI I/O process stopped")
+
+    def _close_rings(self):
+        """🔒 Free both rings once nothing can touch them any more"""
+        with self._rings_lock:
+            for ring in (self.input_ring, self.output_ring):
+                if ring is not None:
+                    ring.close()
+            self.input_ring = self.output_ring = None
+
+    def _read_loop(self):
+        """📥 Deliver input events from the ring to the main-process handler"""
+        try:
+            while not self._stop.is_set():
+                events = self.input_ring.drain()
+                for timestamp, message in events:
+                    try:
+                        self.on_message(message, timestamp)
+                    except Exception as e:
+                        logger.error(f"❌ MIDI input handler failed: {e}")
+                if not events:
+                    self.input_ring.wait(IDLE_TIMEOUT)
+        finally:
+            self._close_rings()
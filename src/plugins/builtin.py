@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔌 Built-in Action Plugins
+In-process actions that avoid spawning a shell for common pad actions.
+"""
+
+import logging
+import os
+import socket
+import stat
+import time
+from pathlib import Path
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+SOCKET_TIMEOUT = 1.0  # ⏰ Upper bound in seconds on connect/send
+
+
+def _split_argument(argument: str) -> Tuple[str, str]:
+    """✂️ Split ``"<target> <payload>"`` into its two parts"""
+    target, _, payload = argument.strip().partition(' ')
+    if not target:
+        raise ValueError("Missing action target")
+    return target, payload
+
+
+def socket_write(argument: str, deadline: float) -> bool:
+    """📡 Write a line to a local socket
+
+    Argument: ``<unix socket path | host:port> <payload>``
+    """
+    target, payload = _split_argument(argument)
+    data = (payload + '\n').encode()
+
+    if target.startswith('/'):
+        family, address = socket.AF_UNIX, target
+    else:
+        host, _, port = target.rpartition(':')
+        family, address = socket.AF_INET, (host or '127.0.0.1', int(port))
+
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(max(0.001, min(SOCKET_TIMEOUT, deadline - time.monotonic())))
+        sock.connect(address)
+        sock.sendall(data)
+
+    logger.debug(f"📡 Wrote {len(data)} bytes to {target}")
+    return True
+
+
+def file_append(argument: str, deadline: float) -> bool:
+    """📝 Append a line to a file or FIFO
+
+    Argument: ``<path> <text>``
+    """
+    target, payload = _split_argument(argument)
+    path = Path(target).expanduser()
+
+    if path.exists() and stat.S_ISFIFO(path.stat().st_mode):
+        # A blocking open would hang until a reader shows up; fail fast instead (ENXIO)
+        fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            os.write(fd, (payload + '\n').encode())
+        finally:
+            os.close(fd)
+    else:
+        with open(path, 'a') as f:
+            f.write(payload + '\n')
+
+    logger.debug(f"📝 Appended to {path}")
+    return True
+
+
+# 🗂️ Action name -> callable, registered by ActionHandler on startup
+ACTIONS = {
+    'socket': socket_write,
+    'file': file_append,
+}
@@ -20,6 +20,7 @@ class Colors:
 # 🎹 MIDI Constants
 MIDI_NOTE_ON = 0x90  # Note On message
 MIDI_NOTE_OFF = 0x80  # Note Off message
+MIDI_CONTROL_CHANGE = 0xB0  # Control Change message (top row and side buttons)
 
 # 🎛️ Grid Constants
 GRID_SIZE = 8  # Standard 8x8 grid
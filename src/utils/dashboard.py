@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+📺 Dashboard Module
+Live terminal dashboard rendered from snapshots at a fixed refresh rate.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Group
+from rich.live import Live
+from rich.logging import RichHandler
+from rich.panel import Panel
+from rich.table import Table
+
+from .constants import GRID_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 🌡️ Heatmap shades from cold to hot
+HEAT_STYLES = ["grey23", "blue", "cyan", "green", "yellow", "red"]
+
+
+class DashboardState:
+    """📊 Counters updated from the event path; cheap to write, copied to render"""
+
+    def __init__(self, recent_size: int = 10, latency_size: int = 1000):
+        self.press_counts = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+        self.running: Dict[int, Tuple[str, float]] = {}
+        self.recent = deque(maxlen=recent_size)
+        self.latencies = deque(maxlen=latency_size)
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def record_press(self, x: int, y: int):
+        """🎯 Count a pad press (pads outside the 8x8 grid are ignored)"""
+        if 1 <= x <= GRID_SIZE and 1 <= y <= GRID_SIZE:
+            with self._lock:
+                self.press_counts[y - 1][x - 1] += 1
+
+    def job_started(self, alias: str, timestamp: Optional[float] = None) -> int:
+        """▶️ Track a running alias; ``timestamp`` is when the triggering press arrived"""
+        job_id = next(self._ids)
+        with self._lock:
+            self.running[job_id] = (alias, timestamp if timestamp is not None else time.monotonic())
+        return job_id
+
+    def job_finished(self, job_id: int, success: bool):
+        """⏹️ Record the result and press-to-completion latency of a job"""
+        now = time.monotonic()
+        with self._lock:
+            alias, started = self.running.pop(job_id, ("?", now))
+            self.latencies.append(now - started)
+            self.recent.append((alias, success, now - started))
+
+    def snapshot(self) -> dict:
+        """📸 Consistent copy of the state for rendering"""
+        with self._lock:
+            return {
+                'press_counts': [row[:] for row in self.press_counts],
+                'running': list(self.running.values()),
+                'recent': list(self.recent),
+                'latencies': list(self.latencies),
+            }
+
+
+class Dashboard:
+    """📺 Renders a ``DashboardState`` on its own thread at ``refresh_hz``
+
+    While running, console logging is moved onto the live display's console at
+    ``log_level`` so log lines print above the dashboard instead of tearing it.
+    """
+
+    def __init__(self, state: DashboardState, refresh_hz: float = 4.0,
+                 log_level: int = logging.WARNING):
+        self.state = state
+        self.refresh_hz = refresh_hz
+        self.log_level = log_level
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._live: Optional[Live] = None
+        self._console_handlers: List[logging.Handler] = []
+        self._original_handlers: List[logging.Handler] = []
+        self._rich_handler: Optional[RichHandler] = None
+
+    def start(self):
+        """▶️ Start rendering"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._live = Live(self.render(self.state.snapshot()), auto_refresh=False)
+        self._live.start()
+        self._capture_logging()
+        self._thread = threading.Thread(target=self._run, name="dashboard", daemon=True)
+        self._thread.start()
+        logger.info(f"📺 Dashboard started at {self.refresh_hz} Hz")
+
+    def stop(self):
+        """⏹️ Stop rendering and restore the terminal"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        self._release_logging()
+        if self._live:
+            self._live.stop()
+            self._live = None
+
+    def _capture_logging(self):
+        """🪝 Swap root console handlers for one that prints through the live console"""
+        root = logging.getLogger()
+        self._original_handlers = list(root.handlers)
+        self._console_handlers = [
+            handler for handler in root.handlers
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+        ]
+        for handler in self._console_handlers:
+            root.removeHandler(handler)
+
+        self._rich_handler = RichHandler(console=self._live.console, show_path=False)
+        self._rich_handler.setLevel(self.log_level)
+        root.addHandler(self._rich_handler)
+
+    def _release_logging(self):
+        """↩️ Restore the original console handlers, in their original order"""
+        root = logging.getLogger()
+        if self._rich_handler:
+            root.removeHandler(self._rich_handler)
+            self._rich_handler = None
+
+        # Handlers added while the dashboard ran stay, after the original ones
+        current = list(root.handlers)
+        restored = [h for h in self._original_handlers if h in current or h in self._console_handlers]
+        restored += [h for h in current if h not in restored]
+        for handler in current:
+            root.removeHandler(handler)
+        for handler in restored:
+            root.addHandler(handler)
+        self._console_handlers = []
+        self._original_handlers = []
+
+    def _run(self):
+        interval = 1 / self.refresh_hz
+        while not self._stop.wait(interval):
+            try:
+                self._live.update(self.render(self.state.snapshot()), refresh=True)
+            except Exception as e:
+                logger.error(f"❌ Dashboard render failed: {e}")
+
+    def render(self, snapshot: dict) -> Group:
+        """🎨 Build the dashboard from a snapshot"""
+        return Group(
+            self._render_heatmap(snapshot['press_counts']),
+            self._render_jobs(snapshot['running']),
+            self._render_recent(snapshot['recent']),
+            self._render_latency(snapshot['latencies']),
+        )
+
+    def _render_heatmap(self, counts: List[List[int]]) -> Panel:
+        """🌡️ 8x8 press-count heatmap, top row of the device first"""
+        peak = max(max(row) for row in counts) or 1
+        table = Table.grid(padding=(0, 1))
+        for row in reversed(counts):
+            cells = []
+            for count in row:
+                cells.append(f"[{HEAT_STYLES[self._heat_level(count, peak)]}]{count:>4}[/]")
+            table.add_row(*cells)
+        return Panel(table, title="🎹 Presses")
+
+    @staticmethod
+    def _heat_level(count: int, peak: int) -> int:
+        """🌡️ Index into ``HEAT_STYLES``: 0 for untouched pads, the hottest shade at ``peak``"""
+        if not count:
+            return 0
+        return 1 + (count * (len(HEAT_STYLES) - 2)) // peak
+
+    def _render_jobs(self, running: List[Tuple[str, float]]) -> Panel:
+        """⚙️ Aliases currently executing"""
+        now = time.monotonic()
+        table = Table("Alias", "Running", box=None)
+        for alias, started in running:
+            table.add_row(alias, f"{now - started:.1f}s")
+        return Panel(table, title=f"⚙️ Running ({len(running)})")
+
+    def _render_recent(self, recent: List[Tuple[str, bool, float]]) -> Panel:
+        """📜 Latest alias results"""
+        table = Table("Alias", "Result", "Latency", box=None)
+        for alias, success, latency in reversed(recent):
+            table.add_row(alias, "✅" if success else "❌", f"{latency * 1000:.0f} ms")
+        return Panel(table, title="📜 Recent")
+
+    def _render_latency(self, latencies: List[float]) -> Panel:
+        """⏱️ Press-to-completion latency percentiles"""
+        if not latencies:
+            return Panel("No executions yet", title="⏱️ Latency")
+
+        ordered = sorted(latencies)
+        cells = [f"p{p}: {self._percentile(ordered, p) * 1000:.0f} ms" for p in (50, 90, 99)]
+        return Panel("   ".join(cells), title=f"⏱️ Latency (n={len(ordered)})")
+
+    @staticmethod
+    def _percentile(ordered: List[float], p: int) -> float:
+        """📐 Nearest-rank percentile of a sorted, non-empty list"""
+        rank = -(-len(ordered) * p // 100)  # ceil(n * p / 100)
+        return ordered[max(rank, 1) - 1]
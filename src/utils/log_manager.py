@@ -8,6 +8,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 import os
+import threading
 
 class LogManager:
     def __init__(self, log_dir: str = "logs"):
@@ -31,6 +32,9 @@ class LogManager:
         # Setup JSON data stores
         self.alias_data = []
         self.button_data = []
+        
+        # Actions finish on worker threads; serialize the JSON rewrites
+        self._lock = threading.Lock()
     
     def _setup_logger(self, name: str, log_file: Path) -> logging.Logger:
         """Setup individual logger with file handler"""
@@ -47,14 +51,16 @@ class LogManager:
         
         return logger
     
-    def log_alias_execution(self, alias: str, success: bool, output: str = None, error: str = None):
+    def log_alias_execution(self, alias: str, success: bool, output: str = None, error: str = None,
+                            latency_ms: float = None):
         """Log alias execution details"""
         status = "✅ SUCCESS" if success else "❌ FAILED"
         timestamp = datetime.now().isoformat()
+        latency = f" | Latency: {latency_ms:.1f} ms" if latency_ms is not None else ""
         
         # Log to file
         self.alias_logger.info(
-            f"Alias: {alias} | Status: {status}\n"
+            f"Alias: {alias} | Status: {status}{latency}\n"
             f"Output: {output}\n"
             f"Error: {error}\n"
             f"{'-'*50}"
@@ -66,7 +72,8 @@ class LogManager:
             "alias": alias,
             "success": success,
             "output": output,
-            "error": error
+            "error": error,
+            "latency_ms": latency_ms
         })
         
         # Write JSON
@@ -83,6 +90,7 @@ class LogManager:
             f"Mapped Alias: {button_info.get('alias', 'None')}\n"
             f"Quadrant: {button_info.get('quadrant', 'Unknown')}\n"
             f"Color: {button_info.get('color', 'Unknown')}\n"
+            f"Event: {button_info.get('event_type', 'unknown')}\n"
             f"{'-'*50}"
         )
         
@@ -99,7 +107,7 @@ class LogManager:
     def _write_json(self, filename: str, data: list):
         """Write data to JSON file"""
         json_path = self.log_dir / filename
-        with open(json_path, 'w') as f:
+        with self._lock, open(json_path, 'w') as f:
             json.dump(data, f, indent=2)
     
     def get_session_summary(self) -> dict:
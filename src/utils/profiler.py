@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🔬 Runtime Profiler Module
+On-demand sampling profiler and tracemalloc windows for a running daemon.
+"""
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 💤 Leaf frames of parked threads: stdlib waits, plus this app's idle loops whose
+# blocking call (SimpleQueue.get, a semaphore, signal.pause) happens in C
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("worker_pool.py", "_work"),
+    ("profiler.py", "_control"),
+    ("shm_ring.py", "wait"),
+    ("app.py", "run"),
+}
+
+
+class RuntimeProfiler:
+    """🔬 Starts/stops profiling windows and dumps results to the log directory
+
+    Nothing here touches the event path: the CPU profiler samples every thread's
+    stack from its own thread, and tracemalloc is only enabled inside a window.
+    Parked threads (see ``IDLE_FRAMES``) are left out of the profile, and stacks
+    are rooted at their thread name.
+    The toggles are safe to install as signal handlers: they only enqueue a
+    request, and a control thread does the locking and thread startup.
+    """
+
+    def __init__(self, log_dir: str = "logs", window: float = 30.0,
+                 interval: float = 0.005, top: int = 25):
+        self.log_dir = Path(log_dir)
+        self.window = window
+        self.interval = interval
+        self.top = top
+        self._cpu_stop: Optional[threading.Event] = None
+        self._memory_stop: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        # SimpleQueue.put is reentrant, so signal handlers can use it
+        self._requests = queue.SimpleQueue()
+        threading.Thread(target=self._control, name="profiler-control", daemon=True).start()
+
+    def toggle_cpu(self, *args):
+        """🔁 Start a CPU sampling window, or end the running one early"""
+        self._requests.put("cpu")
+
+    def toggle_memory(self, *args):
+        """🔁 Start a tracemalloc window, or end the running one early"""
+        self._requests.put("memory")
+
+    def handle_action(self, argument: str, deadline: Optional[float] = None) -> bool:
+        """🎛️ Action entry point: ``cpu`` or ``memory`` toggles the matching window"""
+        target = argument.strip()
+        if target not in ("cpu", "memory"):
+            raise ValueError(f"Unknown profiling target: {target}")
+        self._requests.put(target)
+        return True
+
+    def _control(self):
+        """🎛️ Apply toggle requests outside of signal context"""
+        while True:
+            target = self._requests.get()
+            try:
+                if target == "cpu":
+                    self._toggle_cpu()
+                else:
+                    self._toggle_memory()
+            except Exception as e:
+                logger.error(f"❌ Profiler toggle failed: {e}")
+
+    def _toggle_cpu(self):
+        with self._lock:
+            if self._cpu_stop is not None:
+                self._cpu_stop.set()
+                return
+
+            self._cpu_stop = threading.Event()
+            threading.Thread(
+                target=self._sample, args=(self._cpu_stop,), name="cpu-profiler", daemon=True
+            ).start()
+        logger.info(f"🔬 CPU profiling started ({self.window:.0f}s window)")
+
+    def _toggle_memory(self):
+        with self._lock:
+            if self._memory_stop is not None:
+                self._memory_stop.set()
+                return
+
+            self._memory_stop = threading.Event()
+            threading.Thread(
+                target=self._trace_memory, args=(self._memory_stop,), name="memory-profiler", daemon=True
+            ).start()
+        logger.info(f"🧠 Memory tracing started ({self.window:.0f}s window)")
+
+    def _sample(self, stop: threading.Event):
+        """📸 Sample all thread stacks until the window ends, then dump them"""
+        own_id = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+
+        try:
+            deadline = time.monotonic() + self.window
+            while time.monotonic() < deadline and not stop.wait(self.interval):
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_id:
+                        continue
+                    code = frame.f_code
+                    if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                        frame = frame.f_back
+                    stack.append(names.get(thread_id, str(thread_id)))
+                    stacks[";".join(reversed(stack))] += 1
+                samples += 1
+
+            path = self._output_path("cpu_profile", "folded")
+            with open(path, 'w') as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+
+            leaves = Counter()
+            for stack, count in stacks.items():
+                frames = stack.split(";")
+                leaves[f"[{frames[0]}] {frames[-1]}"] += count
+            total = sum(leaves.values()) or 1
+
+            logger.info(
+                f"🔬 CPU profile: {samples} samples, {sum(leaves.values())} busy thread samples "
+                f"written to {path}"
+            )
+            for leaf, count in leaves.most_common(self.top):
+                logger.info(f"   • {count / total:6.1%} {leaf}")
+
+        except Exception as e:
+            logger.error(f"❌ CPU profiling failed: {e}")
+
+        finally:
+            with self._lock:
+                self._cpu_stop = None
+
+    def _trace_memory(self, stop: threading.Event):
+        """🧠 Trace allocations over the window and dump the growth"""
+        started_here = not tracemalloc.is_tracing()
+        try:
+            if started_here:
+                tracemalloc.start(25)
+            before = tracemalloc.take_snapshot()
+            stop.wait(self.window)
+            after = tracemalloc.take_snapshot()
+
+            path = self._output_path("memory_trace", "snapshot")
+            after.dump(str(path))
+
+            current, peak = tracemalloc.get_traced_memory()
+            logger.info(
+                f"🧠 Memory trace written to {path} "
+                f"(current {current / 1024:.0f} KiB, peak {peak / 1024:.0f} KiB)"
+            )
+            for stat in after.compare_to(before, 'lineno')[:self.top]:
+                logger.info(f"   • {stat}")
+
+        except Exception as e:
+            logger.error(f"❌ Memory tracing failed: {e}")
+
+        finally:
+            if started_here:
+                tracemalloc.stop()
+            with self._lock:
+                self._memory_stop = None
+
+    def _output_path(self, prefix: str, suffix: str) -> Path:
+        self.log_dir.mkdir(exist_ok=True)
+        return self.log_dir / f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{suffix}"
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🗄️ Result Cache Module
+TTL cache with single-flight and stale-while-revalidate for idempotent actions.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """📋 Per-mapping caching rules"""
+    ttl: float                   # ⏱️ Seconds a result is served as fresh
+    stale_ttl: float = 0.0       # 🥱 Extra seconds served stale while refreshing
+    env: Tuple[str, ...] = ()    # 🌱 Environment variables that change the result
+    include_cwd: bool = True     # 📂 Whether the working directory changes the result
+    cache_failures: bool = False # ❌ Whether failed results are cached too
+
+    def key(self, action: str) -> tuple:
+        """🔑 Build the cache key for an action under the current env/cwd"""
+        return (
+            action,
+            os.getcwd() if self.include_cwd else None,
+            tuple((name, os.environ.get(name)) for name in self.env)
+        )
+
+
+def _resolved(value: Any) -> Future:
+    """✅ A future that already holds ``value``"""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class ResultCache:
+    """🗄️ Caches action results so repeated presses share one run"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._entries: Dict[tuple, Tuple[Any, float]] = {}
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_run(self, key: tuple, policy: CachePolicy, func: Callable[[], Any],
+                   cacheable: Optional[Callable[[Any], bool]] = None) -> Tuple[Any, bool]:
+        """
+        🎯 Return ``(result, cached)`` for ``key``, running ``func`` only when needed
+
+        Concurrent callers for the same key wait on a single run. Results past their
+        TTL but inside ``stale_ttl`` are returned immediately while a background
+        refresh runs. Exceptions from ``func`` propagate and are never cached, and
+        neither are results rejected by ``cacheable``.
+        """
+        future, cached, leader = self._claim(key, policy, func, cacheable)
+        if leader:
+            return self._fill(key, func, future, cacheable), False
+        return future.result(), cached
+
+    def get_or_submit(self, key: tuple, policy: CachePolicy, func: Callable[[], Any],
+                      submit: Callable[..., Future],
+                      cacheable: Optional[Callable[[Any], bool]] = None) -> Tuple[Future, bool]:
+        """
+        🚀 Non-blocking ``get_or_run``: return ``(future, cached)`` without waiting
+
+        Fresh and stale results come back as already-resolved futures and joins get
+        the in-flight run's future, so neither occupies a thread. Only a needed run is
+        handed to ``submit(fn, *args)`` (e.g. a worker pool's ``submit``).
+        """
+        future, cached, leader = self._claim(key, policy, func, cacheable)
+        if leader:
+            try:
+                job = submit(self._fill, key, func, future, cacheable)
+            except BaseException as e:
+                self._abort(key, future, e)
+                raise
+            # A run cancelled before it started must not strand its waiters
+            job.add_done_callback(
+                lambda job: job.cancelled() and self._abort(key, future, CancelledError())
+            )
+        return future, cached
+
+    def invalidate(self, key: Optional[tuple] = None):
+        """🧹 Drop one cached result, or all of them"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _claim(self, key: tuple, policy: CachePolicy, func: Callable[[], Any],
+               cacheable: Optional[Callable[[Any], bool]]) -> Tuple[Future, bool, bool]:
+        """🎫 Resolve ``key`` to ``(future, cached, leader)``; a leader must fill ``future``"""
+        stale = refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = self.clock() - stored_at
+                if age < policy.ttl:
+                    return _resolved(value), True, False
+                if age < policy.ttl + policy.stale_ttl:
+                    stale = True
+                    refresh = key not in self._inflight
+                    if refresh:
+                        future = self._inflight[key] = Future()
+                else:
+                    del self._entries[key]
+
+            if not stale:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[key] = Future()
+
+        if stale:
+            if refresh:
+                threading.Thread(
+                    target=self._refresh, args=(key, func, future, cacheable), daemon=True
+                ).start()
+                logger.debug(f"🥱 Serving stale result while refreshing: {key[0]}")
+            return _resolved(value), True, False
+
+        if not leader:
+            logger.debug(f"🤝 Joining in-flight run: {key[0]}")
+        return future, not leader, leader
+
+    def _abort(self, key: tuple, future: Future, error: BaseException):
+        """💥 Fail an in-flight run that will never be filled"""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if not future.done():
+            future.set_exception(error)
+
+    def _fill(self, key: tuple, func: Callable[[], Any], future: Future,
+              cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """⚙️ Run ``func`` and publish its result to the cache and any waiters"""
+        try:
+            value = func()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if cacheable is None or cacheable(value):
+                self._entries[key] = (value, self.clock())
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def _refresh(self, key: tuple, func: Callable[[], Any], future: Future,
+                 cacheable: Optional[Callable[[Any], bool]] = None):
+        """🔄 Background revalidation of a stale entry"""
+        try:
+            self._fill(key, func, future, cacheable)
+        except Exception as e:
+            logger.error(f"❌ Background refresh failed for {key[0]}: {e}")
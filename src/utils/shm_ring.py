@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+💍 Shared-Memory Ring Module
+Single-producer/single-consumer ring buffer of MIDI messages in shared memory.
+"""
+
+import logging
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 🧱 Layout: [head u64][tail u64][capacity u64][max_message u64] then fixed-size slots,
+# each holding a timestamp, the message length and up to ``max_message`` bytes
+_HEADER = struct.Struct('<QQQQ')
+_INDICES = struct.Struct('<QQ')
+_RECORD = struct.Struct('<dH')  # timestamp, length; payload follows
+
+MAX_MESSAGE = 512  # 📏 Default payload bytes per slot (room for full-grid LED SysEx)
+
+Message = Tuple[float, List[int]]
+
+
+def _slot_size(max_message: int) -> int:
+    """📐 Bytes per slot, rounded up to keep timestamps 8-byte aligned"""
+    return (_RECORD.size + max_message + 7) // 8 * 8
+
+
+class SharedRing:
+    """💍 Lock-free SPSC ring of ``(timestamp, message bytes)`` records
+
+    Messages of any length from 1 to ``max_message`` bytes (note, CC, clock, SysEx)
+    are stored as-is. Exactly one process may call ``push`` and exactly one may call
+    ``pop``/``drain``. The producer only writes ``head`` and the consumer only writes
+    ``tail``, so no lock is needed across processes.
+
+    ``wakeup`` is an optional semaphore shared by both ends (a
+    ``multiprocessing.Semaphore`` across processes). ``push`` releases it when the
+    ring goes from empty to non-empty, so a consumer that found the ring empty can
+    block in ``wait`` instead of polling.
+    """
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 1024,
+                 max_message: int = MAX_MESSAGE, wakeup=None):
+        self.dropped = 0
+        self.wakeup = wakeup
+
+        if name is None:
+            slot = _slot_size(max_message)
+            self.shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + capacity * slot)
+            _HEADER.pack_into(self.shm.buf, 0, 0, 0, capacity, max_message)
+            self._owner = True
+        else:
+            # Attaching side takes the geometry chosen by the creator
+            self.shm = shared_memory.SharedMemory(name=name)
+            self._owner = False
+
+        self.capacity, self.max_message = _HEADER.unpack_from(self.shm.buf, 0)[2:]
+        self._slot = _slot_size(self.max_message)
+        self.name = self.shm.name
+        logger.debug(f"💍 SharedRing {'created' if self._owner else 'attached'}: {self.name}")
+
+    def push(self, timestamp: float, message: List[int]) -> bool:
+        """➕ Append a message; returns False (and counts a drop) when full
+
+        Raises ``ValueError`` for empty messages, bytes outside 0-255, or messages
+        longer than ``max_message``.
+        """
+        data = bytes(message)
+        if not data or len(data) > self.max_message:
+            raise ValueError(f"Message length {len(data)} outside 1..{self.max_message} bytes")
+
+        buf = self.shm.buf
+        head, tail = _INDICES.unpack_from(buf, 0)
+        if head - tail >= self.capacity:
+            self.dropped += 1
+            return False
+
+        offset = _HEADER.size + (head % self.capacity) * self._slot
+        _RECORD.pack_into(buf, offset, timestamp, len(data))
+        start = offset + _RECORD.size
+        buf[start:start + len(data)] = data
+
+        # Publish only after the record is fully written
+        struct.pack_into('<Q', buf, 0, head + 1)
+
+        # A consumer only sleeps after seeing the ring empty, so only that transition needs a wake-up
+        if head == tail:
+            self.notify()
+        return True
+
+    def pop(self) -> Optional[Message]:
+        """➖ Remove the oldest message, or return None when empty"""
+        buf = self.shm.buf
+        head, tail = _INDICES.unpack_from(buf, 0)
+        if tail == head:
+            return None
+
+        message = self._read(buf, tail)
+        struct.pack_into('<Q', buf, 8, tail + 1)
+        return message
+
+    def drain(self, limit: Optional[int] = None) -> List[Message]:
+        """📥 Pop every available message (up to ``limit``)"""
+        buf = self.shm.buf
+        head, tail = _INDICES.unpack_from(buf, 0)
+        count = head - tail if limit is None else min(head - tail, limit)
+
+        messages = [self._read(buf, index) for index in range(tail, tail + count)]
+
+        if count:
+            struct.pack_into('<Q', buf, 8, tail + count)
+        return messages
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """😴 Block until a push or ``notify`` (or ``timeout``); call after draining to empty"""
+        if self.wakeup is None:
+            time.sleep(timeout or 0)
+            return False
+        return self.wakeup.acquire(timeout=timeout)
+
+    def notify(self):
+        """🔔 Wake the consumer, e.g. so it notices a stop request"""
+        if self.wakeup is not None:
+            self.wakeup.release()
+
+    def _read(self, buf, index: int) -> Message:
+        offset = _HEADER.size + (index % self.capacity) * self._slot
+        timestamp, length = _RECORD.unpack_from(buf, offset)
+        start = offset + _RECORD.size
+        return timestamp, list(buf[start:start + length])
+
+    def close(self):
+        """🔒 Detach, and free the segment if this side created it"""
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+⏱️ Timing Wheel Module
+Hashed timing wheel for cheap, cancellable timeouts driven by a single thread.
+"""
+
+import itertools
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Timeout:
+    """⏳ Handle for a scheduled timeout"""
+
+    __slots__ = ('id', 'deadline_tick', 'callback', 'args', 'cancelled', '_wheel')
+
+    def __init__(self, timeout_id: int, deadline_tick: int, callback: Callable, args: tuple, wheel: 'TimingWheel'):
+        self.id = timeout_id
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._wheel = wheel
+
+    def cancel(self) -> bool:
+        """🚫 Cancel the timeout; returns False if it already fired or was cancelled"""
+        return self._wheel.cancel(self)
+
+
+class TimingWheel:
+    """🎡 Hashed timing wheel with O(1) schedule and cancel
+
+    Time is passed in explicitly (seconds, same base as ``clock``) so the wheel can
+    be driven either by its own timer thread or by replayed timestamps.
+    """
+
+    def __init__(self, tick: float = 0.01, wheel_size: int = 512,
+                 clock: Callable[[], float] = time.monotonic):
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.clock = clock
+        self._slots: List[Dict[int, Timeout]] = [{} for _ in range(wheel_size)]
+        self._current_tick: Optional[int] = None
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        logger.debug(f"🎡 TimingWheel created: tick={tick}s, slots={wheel_size}")
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def schedule(self, delay: float, callback: Callable, *args, now: Optional[float] = None) -> Timeout:
+        """➕ Schedule ``callback(*args)`` to run ``delay`` seconds after ``now``"""
+        if now is None:
+            now = self.clock()
+
+        with self._lock:
+            if self._current_tick is None:
+                self._current_tick = int(now / self.tick)
+
+            deadline_tick = max(math.ceil((now + delay) / self.tick), self._current_tick + 1)
+            timeout = Timeout(next(self._ids), deadline_tick, callback, args, self)
+            self._slots[deadline_tick % self.wheel_size][timeout.id] = timeout
+            self._pending += 1
+
+        return timeout
+
+    def cancel(self, timeout: Timeout) -> bool:
+        """🚫 Remove a pending timeout from its slot"""
+        with self._lock:
+            slot = self._slots[timeout.deadline_tick % self.wheel_size]
+            if slot.pop(timeout.id, None) is None:
+                return False
+            timeout.cancelled = True
+            self._pending -= 1
+            return True
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """⏩ Fire every timeout due at or before ``now``; returns how many fired"""
+        if now is None:
+            now = self.clock()
+
+        expired: List[Timeout] = []
+        with self._lock:
+            target_tick = int(now / self.tick)
+            if self._current_tick is None:
+                self._current_tick = target_tick
+                return 0
+
+            # A gap longer than one revolution only needs each slot visited once
+            steps = min(target_tick - self._current_tick, self.wheel_size)
+            start_tick = target_tick - steps
+            for step in range(1, steps + 1):
+                slot = self._slots[(start_tick + step) % self.wheel_size]
+                if not slot:
+                    continue
+                due = [t for t in slot.values() if t.deadline_tick <= target_tick]
+                for timeout in due:
+                    del slot[timeout.id]
+                expired.extend(due)
+
+            self._current_tick = max(self._current_tick, target_tick)
+            self._pending -= len(expired)
+
+        expired.sort(key=lambda t: (t.deadline_tick, t.id))
+        for timeout in expired:
+            try:
+                timeout.callback(*timeout.args)
+            except Exception as e:
+                logger.error(f"❌ Timeout callback failed: {e}")
+
+        return len(expired)
+
+    def start(self):
+        """▶️ Start the driver thread that advances the wheel every tick"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="timing-wheel", daemon=True)
+        self._thread.start()
+        logger.info("⏱️ Timing wheel started")
+
+    def stop(self):
+        """⏹️ Stop the driver thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        logger.info("⏱️ Timing wheel stopped")
+
+    def _run(self):
+        while not self._stop.wait(self.tick):
+            self.advance()
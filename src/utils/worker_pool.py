@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+👷 Worker Pool Module
+Daemon worker threads whose stuck jobs can be abandoned without losing capacity.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Set
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """👷 Fixed-size pool of daemon threads
+
+    Python cannot kill a thread, so when a job overruns its deadline the caller
+    ``abandon``s it: a queued job is cancelled, a running one keeps its thread and a
+    replacement thread is started so the pool never silts up with hung jobs. Once
+    ``max_abandoned`` jobs are stuck at the same time new submissions are refused.
+    Threads are daemons, so hung jobs never hold up interpreter exit.
+    """
+
+    def __init__(self, size: int, name: str = "worker", max_abandoned: int = 16):
+        self.size = size
+        self.name = name
+        self.max_abandoned = max_abandoned
+        self._queue = queue.SimpleQueue()
+        self._abandoned: Set[Future] = set()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        for _ in range(size):
+            self._spawn()
+
+    @property
+    def abandoned(self) -> int:
+        """🧟 Number of abandoned jobs still occupying a thread"""
+        return len(self._abandoned)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """➕ Queue ``func(*args, **kwargs)`` and return its future"""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f"{self.name} pool is shut down")
+            if len(self._abandoned) >= self.max_abandoned:
+                raise RuntimeError(f"{self.name} pool saturated: {len(self._abandoned)} stuck jobs")
+
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def abandon(self, future: Future):
+        """🚫 Give up on a job: cancel it if queued, otherwise replace its thread"""
+        if future.cancel():
+            return
+
+        with self._lock:
+            if future.done() or future in self._abandoned:
+                return
+            self._abandoned.add(future)
+
+        self._spawn()
+        logger.warning(f"⚠️ Replaced stuck {self.name} worker ({len(self._abandoned)} stuck)")
+
+    def shutdown(self):
+        """🛑 Cancel queued jobs and let idle workers exit"""
+        with self._lock:
+            self._shutdown = True
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+
+        for _ in range(self.size):
+            self._queue.put(None)
+
+    def _spawn(self):
+        threading.Thread(
+            target=self._work, name=f"{self.name}-{next(self._ids)}", daemon=True
+        ).start()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            future, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+            with self._lock:
+                if future in self._abandoned:
+                    # A replacement already took this thread's place
+                    self._abandoned.discard(future)
+                    return
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 ActionHandler tests: action resolution, plugin results and timeouts
+"""
+
+import logging
+import threading
+
+import pytest
+
+from src.handlers.action_handler import SHELL_ACTION, ActionHandler, ActionResult
+
+
+@pytest.fixture
+def handler():
+    handler = ActionHandler(plugin_dir=None, default_timeout=0.2)
+    yield handler
+    handler.shutdown()
+
+
+def test_resolve_registered_action(handler):
+    handler.register("echo", lambda argument, deadline: True)
+    assert handler.resolve("echo:hello world") == ("echo", "hello world")
+
+
+def test_resolve_falls_back_to_shell(handler):
+    assert handler.resolve("git_status") == (SHELL_ACTION, "git_status")
+    # A colon only splits when the prefix is a registered action
+    assert handler.resolve("echo a:b") == (SHELL_ACTION, "echo a:b")
+
+
+def test_builtin_actions_registered(handler):
+    assert {SHELL_ACTION, "file", "socket"} <= set(handler.actions)
+
+
+def test_plugin_receives_argument_and_deadline(handler):
+    calls = []
+    handler.register("record", lambda argument, deadline: calls.append((argument, deadline)) or True)
+
+    result = handler.execute("record:abc")
+    assert result == ActionResult(success=True)
+    assert calls[0][0] == "abc"
+    assert isinstance(calls[0][1], float)
+
+
+def test_plugin_result_passed_through(handler):
+    handler.register("fail", lambda argument, deadline: ActionResult(False, error="nope"))
+    result = handler.execute("fail:x")
+    assert not result.success
+    assert result.error == "nope"
+    assert handler.execution_history[-1]['error'] == "nope"
+
+
+def test_plugin_exception_becomes_failure(handler):
+    def boom(argument, deadline):
+        raise ValueError("bad argument")
+
+    handler.register("boom", boom)
+    result = handler.execute("boom:x")
+    assert result == ActionResult(success=False, error="bad argument")
+
+
+def test_file_action(handler, tmp_path):
+    target = tmp_path / "out.txt"
+    assert handler.execute(f"file:{target} first line").success
+    assert handler.execute(f"file:{target} second line").success
+    assert target.read_text() == "first line\nsecond line\n"
+
+
+def test_timeout_returns_failure(handler):
+    release = threading.Event()
+    handler.register("hang", lambda argument, deadline: release.wait())
+    try:
+        result = handler.execute("hang:x")
+    finally:
+        release.set()
+    assert result == ActionResult(success=False, error="Execution timeout")
+
+
+def test_hung_workers_are_replaced():
+    handler = ActionHandler(plugin_dir=None, max_workers=2, default_timeout=0.1)
+    release = threading.Event()
+    handler.register("hang", lambda argument, deadline: release.wait())
+    handler.register("ok", lambda argument, deadline: True)
+    try:
+        # More hung actions than workers; each one is abandoned and its thread replaced
+        for _ in range(3):
+            assert handler.execute("hang:x").error == "Execution timeout"
+        assert handler._workers.abandoned == 3
+        assert handler.execute("ok:x").success
+    finally:
+        release.set()
+        handler.shutdown()
+
+
+def test_submit_runs_callback(handler):
+    handler.register("ok", lambda argument, deadline: ActionResult(True, output=argument))
+    done = threading.Event()
+    results = []
+
+    def callback(result):
+        results.append(result)
+        done.set()
+
+    future = handler.submit("ok:payload", callback=callback)
+    assert future.result(timeout=2).output == "payload"
+    assert done.wait(2)
+    assert results[0].output == "payload"
+
+
+PLUGIN_SOURCE = '''
+from pathlib import Path
+
+Path(__file__).with_name("loaded.marker").touch()
+
+ACTIONS = {"greet": lambda argument, deadline: "hello " + argument}
+'''
+
+
+def test_plugin_dir_is_opt_in(tmp_path, monkeypatch):
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "greet.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.chdir(tmp_path)
+
+    handler = ActionHandler()
+    try:
+        assert "greet" not in handler.actions
+        assert not (plugins / "loaded.marker").exists()
+    finally:
+        handler.shutdown()
+
+
+def test_plugin_dir_loads_actions(tmp_path, caplog):
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "greet.py").write_text(PLUGIN_SOURCE)
+    (plugins / "broken.py").write_text("raise RuntimeError('broken plugin')\n")
+
+    with caplog.at_level(logging.INFO):
+        handler = ActionHandler(plugin_dir=str(plugins))
+    try:
+        assert "greet" in handler.actions
+        assert handler.resolve("greet:world") == ("greet", "world")
+        assert str(plugins.resolve()) in caplog.text
+        assert "broken.py" in caplog.text
+    finally:
+        handler.shutdown()
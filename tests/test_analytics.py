@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 Analytics tests: LogManager round-trip, cross-session stats and the column cache
+"""
+
+import logging
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.analytics import CACHE_DIR, SessionAnalytics, load_columns, parse_alias_log, parse_button_log
+from src.utils.log_manager import LogManager
+
+
+class FixedTime(logging.Filter):
+    """Stamp records with a chosen wall-clock time so asctime is predictable"""
+
+    def __init__(self):
+        super().__init__()
+        self.when = None
+
+    def filter(self, record):
+        if self.when is not None:
+            record.created = self.when.timestamp()
+            record.msecs = self.when.microsecond // 1000
+        return True
+
+
+class Session:
+    """A LogManager session whose files are renamed to ``session_id`` when closed"""
+
+    def __init__(self, log_dir, session_id: str):
+        self.manager = LogManager(str(log_dir))
+        self.session_id = session_id
+        self.clock = FixedTime()
+        self.closed = False
+        for logger in (self.manager.alias_logger, self.manager.button_logger):
+            logger.addFilter(self.clock)
+
+    def press(self, x: int, y: int, when: datetime, event_type: str = 'button_pressed'):
+        self.clock.when = when
+        self.manager.log_button_press({
+            'x': x, 'y': y, 'note': x + y * 10, 'alias': 'ls', 'color': 5,
+            'quadrant': 'Q1', 'event_type': event_type
+        })
+
+    def alias(self, alias: str, success: bool, when: datetime, latency_ms=None):
+        self.clock.when = when
+        self.manager.log_alias_execution(alias, success, output="out", error=None, latency_ms=latency_ms)
+
+    def close(self):
+        self.closed = True
+        # LogManager loggers are process-wide; detach so later sessions write only their own files
+        for logger in (self.manager.alias_logger, self.manager.button_logger):
+            logger.removeFilter(self.clock)
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+        log_dir = self.manager.log_dir
+        for prefix in ("alias_execution", "button_mapping"):
+            os.replace(
+                log_dir / f"{prefix}_{self.manager.session_id}.log",
+                log_dir / f"{prefix}_{self.session_id}.log"
+            )
+
+
+@pytest.fixture
+def session(tmp_path):
+    sessions = []
+
+    def open_session(session_id: str) -> Session:
+        sessions.append(Session(tmp_path, session_id))
+        return sessions[-1]
+
+    yield open_session
+    for s in sessions:
+        if not s.closed:
+            s.close()
+
+
+MORNING = datetime(2024, 5, 1, 3, 15, 0, 250000)
+AFTERNOON = datetime(2024, 5, 2, 15, 45, 30)
+
+
+def test_button_log_round_trip(tmp_path, session):
+    s = session("20240501_031500")
+    s.press(2, 7, MORNING, event_type='mapping_created')
+    s.press(2, 7, MORNING)
+    s.press(3, 1, AFTERNOON)
+    s.close()
+
+    columns = parse_button_log(tmp_path / "button_mapping_20240501_031500.log")
+    assert columns['x'].tolist() == [2, 3]
+    assert columns['y'].tolist() == [7, 1]
+    assert columns['ts'][0] == np.datetime64('2024-05-01T03:15:00.250')
+    assert columns['ts'][1] == np.datetime64('2024-05-02T15:45:30.000')
+
+
+def test_alias_log_round_trip(tmp_path, session):
+    tricky = "echo 'a | Status: ✅ SUCCESS'"
+    s = session("20240501_031500")
+    s.alias("ls", True, MORNING, latency_ms=12.5)
+    s.alias("git pull", False, MORNING)
+    s.alias(tricky, True, AFTERNOON, latency_ms=3.0)
+    s.close()
+
+    columns = parse_alias_log(tmp_path / "alias_execution_20240501_031500.log")
+    names = [str(columns['alias_names'][code]) for code in columns['alias']]
+    assert names == ["ls", "git pull", tricky]
+    assert columns['success'].tolist() == [True, False, True]
+    assert columns['latency_ms'][0] == 12.5
+    assert np.isnan(columns['latency_ms'][1])
+    assert columns['latency_ms'][2] == 3.0
+
+
+def test_session_analytics_across_sessions(tmp_path, session):
+    first = session("20240501_031500")
+    first.press(2, 7, MORNING)
+    first.press(2, 7, MORNING)
+    first.press(9, 1, MORNING)  # Side button outside the 8x8 grid
+    first.alias("a", True, MORNING, latency_ms=10.0)
+    first.alias("b", False, MORNING, latency_ms=30.0)
+    first.close()
+
+    second = session("20240502_154530")
+    second.press(1, 1, AFTERNOON)
+    second.alias("b", True, AFTERNOON, latency_ms=20.0)
+    second.alias("c", True, AFTERNOON)
+    second.alias("b", True, AFTERNOON, latency_ms=40.0)
+    second.close()
+
+    analytics = SessionAnalytics(str(tmp_path), use_cache=False)
+    assert analytics.session_count == 2
+
+    heatmap = analytics.pad_heatmap()
+    assert heatmap.shape == (8, 8)
+    assert heatmap[6, 1] == 2  # (x=2, y=7) is indexed [y - 1, x - 1]
+    assert heatmap[0, 0] == 1
+    assert heatmap.sum() == 3
+
+    assert analytics.alias_success_rates() == [
+        {'alias': 'b', 'executions': 3, 'success_rate': 2 / 3},
+        {'alias': 'a', 'executions': 1, 'success_rate': 1.0},
+        {'alias': 'c', 'executions': 1, 'success_rate': 1.0},
+    ]
+
+    hourly = analytics.hourly_usage()
+    assert len(hourly) == 24
+    assert hourly[3] == 3 and hourly[15] == 1 and hourly.sum() == 4
+
+    trend = analytics.latency_trend()
+    assert [row['day'] for row in trend] == ['2024-05-01', '2024-05-02']
+    assert [row['count'] for row in trend] == [2, 2]
+    assert trend[1]['p50'] == 30.0
+
+
+def test_empty_log_dir(tmp_path):
+    analytics = SessionAnalytics(str(tmp_path))
+    assert analytics.session_count == 0
+    assert analytics.pad_heatmap().sum() == 0
+    assert analytics.alias_success_rates() == []
+    assert analytics.latency_trend() == []
+
+
+def test_column_cache_reused_until_file_changes(tmp_path):
+    log = tmp_path / "button_mapping_20240501_031500.log"
+    log.write_text("")
+    cache_dir = tmp_path / CACHE_DIR
+    calls = []
+
+    def parser(path):
+        calls.append(path)
+        return {'x': np.array([len(calls)], dtype=np.int16)}
+
+    assert load_columns(log, parser, cache_dir)['x'].tolist() == [1]
+    assert (cache_dir / f"{log.stem}.npz").exists()
+    assert load_columns(log, parser, cache_dir)['x'].tolist() == [1]
+    assert len(calls) == 1
+
+    # Size change
+    log.write_text("more")
+    assert load_columns(log, parser, cache_dir)['x'].tolist() == [2]
+
+    # Same size, new mtime
+    stat = log.stat()
+    os.utime(log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_columns(log, parser, cache_dir)['x'].tolist() == [3]
+    assert load_columns(log, parser, cache_dir)['x'].tolist() == [3]
+    assert len(calls) == 3
+
+
+def test_unreadable_cache_is_reparsed(tmp_path):
+    log = tmp_path / "button_mapping_20240501_031500.log"
+    log.write_text("")
+    cache_dir = tmp_path / CACHE_DIR
+    cache_dir.mkdir()
+    (cache_dir / f"{log.stem}.npz").write_bytes(b"not a zip file")
+
+    columns = load_columns(log, lambda path: {'x': np.array([7])}, cache_dir)
+    assert columns['x'].tolist() == [7]
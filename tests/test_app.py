@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 LaunchpadApp gesture wiring tests, with rtmidi replaced by an in-memory fake
+"""
+
+import signal
+import sys
+import types
+
+import pytest
+
+from src.utils.log_manager import LogManager
+
+
+class FakeMidiPort:
+    """Stand-in for rtmidi.MidiIn/MidiOut without a device"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send_message(self, message):
+        self.sent.append(list(message))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    fake = types.ModuleType("rtmidi")
+    fake.MidiIn = fake.MidiOut = FakeMidiPort
+    monkeypatch.setitem(sys.modules, "rtmidi", fake)
+    monkeypatch.delitem(sys.modules, "src.app", raising=False)
+    from src.app import LaunchpadApp
+
+    # LaunchpadApp installs process-wide signal handlers; put pytest's back afterwards
+    saved = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1, signal.SIGUSR2)}
+    app = LaunchpadApp(log_manager=LogManager(str(tmp_path)))
+    app.dispatched = []
+    app._dispatch_action = lambda action, timestamp, source, cache=None: app.dispatched.append((action, source))
+    yield app
+    app.action_handler.shutdown()
+    for sig, handler in saved.items():
+        signal.signal(sig, handler)
+
+
+def press(app, status, note, timestamp):
+    app._handle_midi_message([status, note, 127], timestamp)
+
+
+def release(app, status, note, timestamp):
+    app._handle_midi_message([status, note, 0], timestamp)
+
+
+@pytest.mark.parametrize("gesture", ["longpress", "Tap", ""])
+def test_unknown_gesture_rejected(app, gesture):
+    with pytest.raises(ValueError):
+        app.add_gesture_mapping(gesture, [(1, 1)], "ls")
+    assert app.gesture_pads == set()
+    assert app.gesture_mappings == {}
+
+
+@pytest.mark.parametrize("pads", [[(0, 1)], [(1, 10)], [(10, 3)], []])
+def test_off_device_pads_rejected(app, pads):
+    with pytest.raises(ValueError):
+        app.add_gesture_mapping("long_press", pads, "ls")
+    assert app.gesture_pads == set()
+
+
+def test_single_pad_gestures_take_one_pad(app):
+    with pytest.raises(ValueError):
+        app.add_gesture_mapping("long_press", [(1, 1), (2, 1)], "ls")
+
+
+def test_plain_pad_dispatches_on_press(app):
+    app.add_mapping(1, 1, 5, "plain")
+    press(app, 0x90, 11, 100.0)
+    assert app.dispatched == [("plain", "Alias")]
+
+
+def test_gesture_pad_defers_plain_alias_to_tap(app):
+    app.add_mapping(1, 1, 5, "plain")
+    app.add_gesture_mapping("long_press", [(1, 1)], "held")
+
+    press(app, 0x90, 11, 100.0)
+    assert app.dispatched == []
+    release(app, 0x80, 11, 100.1)
+    assert app.dispatched == [("plain", "Gesture tap")]
+
+    press(app, 0x90, 11, 101.0)
+    app.gesture_recognizer.advance(102.0)
+    release(app, 0x80, 11, 102.1)
+    assert app.dispatched[1:] == [("held", "Gesture long_press")]
+
+
+def test_cc_buttons_feed_gestures(app):
+    # Top-row button (1, 9) sends CC 91
+    app.add_mapping(1, 9, 5, "plain")
+    app.add_gesture_mapping("long_press", [(1, 9)], "held")
+
+    press(app, 0xB0, 91, 100.0)
+    release(app, 0xB0, 91, 100.1)
+    assert app.dispatched == [("plain", "Gesture tap")]
+
+    press(app, 0xB0, 91, 101.0)
+    app.gesture_recognizer.advance(102.0)
+    release(app, 0xB0, 91, 102.1)
+    assert app.dispatched[1:] == [("held", "Gesture long_press")]
+
+
+def test_chord_mapping(app):
+    app.add_gesture_mapping("chord", [(1, 1), (2, 1)], "both")
+    press(app, 0x90, 11, 100.0)
+    press(app, 0x90, 12, 100.02)
+    release(app, 0x90, 11, 100.2)
+    release(app, 0x90, 12, 100.2)
+    assert app.dispatched == [("both", "Gesture chord")]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 Dashboard tests: state counters, rendering helpers and log handler swapping
+"""
+
+import io
+import logging
+
+import pytest
+from rich.console import Console
+from rich.logging import RichHandler
+
+from src.utils.dashboard import HEAT_STYLES, Dashboard, DashboardState
+
+
+def render_text(dashboard: Dashboard, snapshot: dict) -> str:
+    console = Console(file=io.StringIO(), width=120, color_system=None)
+    console.print(dashboard.render(snapshot))
+    return console.file.getvalue()
+
+
+@pytest.mark.parametrize("pad", [(9, 1), (0, 1), (1, 9), (1, 0)])
+def test_presses_outside_grid_are_ignored(pad):
+    state = DashboardState()
+    state.record_press(*pad)
+    assert sum(map(sum, state.snapshot()['press_counts'])) == 0
+
+
+def test_press_counts_indexed_by_row_then_column():
+    state = DashboardState()
+    state.record_press(2, 7)
+    state.record_press(8, 8)
+    counts = state.snapshot()['press_counts']
+    assert counts[6][1] == 1
+    assert counts[7][7] == 1
+
+
+def test_snapshot_returns_copies():
+    state = DashboardState()
+    state.record_press(1, 1)
+    job = state.job_started("ls", timestamp=0.0)
+    snapshot = state.snapshot()
+
+    snapshot['press_counts'][0][0] = 99
+    snapshot['running'].clear()
+    state.record_press(1, 1)
+    state.job_finished(job, True)
+
+    assert snapshot['press_counts'][0][0] == 99
+    assert snapshot['recent'] == [] and snapshot['latencies'] == []
+    fresh = state.snapshot()
+    assert fresh['press_counts'][0][0] == 2
+    assert fresh['running'] == []
+
+
+def test_job_latency_and_recent():
+    state = DashboardState(recent_size=2)
+    for alias in ("a", "b", "c"):
+        state.job_finished(state.job_started(alias), alias != "b")
+    snapshot = state.snapshot()
+    assert [(alias, success) for alias, success, _ in snapshot['recent']] == [("b", False), ("c", True)]
+    assert len(snapshot['latencies']) == 3
+    assert all(latency >= 0 for latency in snapshot['latencies'])
+
+
+@pytest.mark.parametrize("size, expected", [
+    (1, (1, 1, 1)),
+    (10, (5, 9, 10)),
+    (100, (50, 90, 99)),
+    (1000, (500, 900, 990)),
+])
+def test_percentile_nearest_rank(size, expected):
+    ordered = [float(i) for i in range(1, size + 1)]
+    assert tuple(Dashboard._percentile(ordered, p) for p in (50, 90, 99)) == expected
+
+
+def test_latency_panel_text():
+    dashboard = Dashboard(DashboardState())
+    snapshot = DashboardState().snapshot()
+    assert "No executions yet" in render_text(dashboard, snapshot)
+
+    snapshot['latencies'] = [i / 1000 for i in range(100, 0, -1)]
+    text = render_text(dashboard, snapshot)
+    assert "p50: 50 ms" in text and "p90: 90 ms" in text and "p99: 99 ms" in text
+    assert "n=100" in text
+
+
+def test_heat_levels():
+    hottest = len(HEAT_STYLES) - 1
+    assert Dashboard._heat_level(0, 10) == 0
+    assert Dashboard._heat_level(1, 10) == 1
+    assert Dashboard._heat_level(10, 10) == hottest
+    assert Dashboard._heat_level(1, 1) == hottest
+    levels = [Dashboard._heat_level(count, 10) for count in range(11)]
+    assert levels == sorted(levels)
+
+
+def test_heatmap_top_row_first():
+    dashboard = Dashboard(DashboardState())
+    state = DashboardState()
+    for _ in range(7):
+        state.record_press(1, 8)
+    for _ in range(3):
+        state.record_press(1, 1)
+    lines = render_text(dashboard, state.snapshot()).splitlines()
+    top = next(i for i, line in enumerate(lines) if "   7" in line)
+    bottom = next(i for i, line in enumerate(lines) if "   3" in line)
+    assert top < bottom
+
+
+def test_empty_heatmap_renders():
+    dashboard = Dashboard(DashboardState())
+    assert "Presses" in render_text(dashboard, DashboardState().snapshot())
+
+
+def test_logging_swapped_while_running_and_restored():
+    root = logging.getLogger()
+    original = list(root.handlers)
+    console = logging.StreamHandler(io.StringIO())
+    log_file = logging.FileHandler("/dev/null")
+    root.addHandler(console)
+    root.addHandler(log_file)
+    before = list(root.handlers)
+
+    dashboard = Dashboard(DashboardState(), refresh_hz=50, log_level=logging.ERROR)
+    dashboard.start()
+    try:
+        assert console not in root.handlers
+        assert log_file in root.handlers
+        rich_handlers = [h for h in root.handlers if isinstance(h, RichHandler)]
+        assert len(rich_handlers) == 1 and rich_handlers[0].level == logging.ERROR
+    finally:
+        dashboard.stop()
+        try:
+            assert root.handlers == before
+        finally:
+            for handler in (console, log_file):
+                root.removeHandler(handler)
+            log_file.close()
+    assert root.handlers == original
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 Gesture replay tests: long-press, double-tap, chord and cancellation
+"""
+
+from src.handlers.gesture_handler import GestureRecognizer, Gestures
+from src.utils.timing_wheel import TimingWheel
+
+PAD = (1, 1)
+OTHER = (2, 1)
+
+
+def make_recognizer(**kwargs) -> GestureRecognizer:
+    return GestureRecognizer(lambda event: None, wheel=TimingWheel(tick=0.01), **kwargs)
+
+
+def names(events):
+    return [event.gesture for event in events]
+
+
+def test_tap_fires_on_release():
+    recognizer = make_recognizer()
+    events = recognizer.replay([(100.0, PAD, True), (100.1, PAD, False)])
+    assert names(events) == [Gestures.TAP]
+    assert events[0].pads == frozenset([PAD])
+    assert events[0].timestamp == 100.1
+
+
+def test_long_press_suppresses_tap():
+    recognizer = make_recognizer(long_press_ms=500)
+    events = recognizer.replay([(100.0, PAD, True), (101.0, PAD, False)], until=102.0)
+    assert names(events) == [Gestures.LONG_PRESS]
+    assert abs(events[0].timestamp - 100.5) < 1e-9
+
+
+def test_long_press_fires_while_still_held():
+    recognizer = make_recognizer(long_press_ms=500)
+    events = recognizer.replay([(100.0, PAD, True)], until=100.6)
+    assert names(events) == [Gestures.LONG_PRESS]
+
+
+def test_release_before_threshold_cancels_long_press():
+    recognizer = make_recognizer(long_press_ms=500)
+    events = recognizer.replay([(100.0, PAD, True), (100.2, PAD, False)], until=105.0)
+    assert names(events) == [Gestures.TAP]
+    assert len(recognizer.wheel) == 0
+
+
+def test_double_tap_on_registered_pad():
+    recognizer = make_recognizer(double_tap_ms=300)
+    recognizer.register_double_tap(PAD)
+    events = recognizer.replay([
+        (100.0, PAD, True), (100.05, PAD, False),
+        (100.2, PAD, True), (100.25, PAD, False),
+    ], until=101.0)
+    assert names(events) == [Gestures.DOUBLE_TAP]
+    assert events[0].timestamp == 100.25
+
+
+def test_single_tap_on_double_tap_pad_waits_for_window():
+    recognizer = make_recognizer(double_tap_ms=300)
+    recognizer.register_double_tap(PAD)
+    timeline = [(100.0, PAD, True), (100.05, PAD, False)]
+
+    assert recognizer.replay(timeline, until=100.2) == []
+    events = recognizer.replay([], until=100.4)
+    assert names(events) == [Gestures.TAP]
+    assert abs(events[0].timestamp - 100.35) < 1e-9
+
+
+def test_slow_taps_on_double_tap_pad_are_two_taps():
+    recognizer = make_recognizer(double_tap_ms=300)
+    recognizer.register_double_tap(PAD)
+    events = recognizer.replay([
+        (100.0, PAD, True), (100.05, PAD, False),
+        (101.0, PAD, True), (101.05, PAD, False),
+    ], until=102.0)
+    assert names(events) == [Gestures.TAP, Gestures.TAP]
+
+
+def test_chord_consumes_its_pads():
+    recognizer = make_recognizer(chord_window_ms=80)
+    recognizer.register_chord([PAD, OTHER])
+    events = recognizer.replay([
+        (100.0, PAD, True), (100.03, OTHER, True),
+        (100.2, PAD, False), (100.25, OTHER, False),
+    ], until=102.0)
+    assert names(events) == [Gestures.CHORD]
+    assert events[0].pads == frozenset([PAD, OTHER])
+
+
+def test_presses_outside_chord_window_are_taps():
+    recognizer = make_recognizer(chord_window_ms=80)
+    recognizer.register_chord([PAD, OTHER])
+    events = recognizer.replay([
+        (100.0, PAD, True), (100.2, OTHER, True),
+        (100.3, PAD, False), (100.35, OTHER, False),
+    ], until=102.0)
+    assert names(events) == [Gestures.TAP, Gestures.TAP]
+
+
+def test_replay_is_deterministic():
+    timeline = [
+        (100.0, PAD, True), (100.05, PAD, False),
+        (100.2, PAD, True), (100.25, PAD, False),
+        (101.0, OTHER, True), (102.0, OTHER, False),
+    ]
+    results = []
+    for _ in range(2):
+        recognizer = make_recognizer()
+        recognizer.register_double_tap(PAD)
+        results.append(recognizer.replay(timeline, until=103.0))
+    assert results[0] == results[1]
+    assert names(results[0]) == [Gestures.DOUBLE_TAP, Gestures.LONG_PRESS]
+
+
+def test_timing_wheel_fires_due_timeouts():
+    wheel = TimingWheel(tick=0.01, wheel_size=8)
+    fired = []
+    wheel.advance(10.0)
+    wheel.schedule(0.05, fired.append, "soon", now=10.0)
+    wheel.schedule(0.5, fired.append, "later", now=10.0)  # Wraps the 8-slot wheel
+
+    assert wheel.advance(10.04) == 0
+    assert wheel.advance(10.06) == 1
+    assert fired == ["soon"]
+    assert wheel.advance(10.6) == 1
+    assert fired == ["soon", "later"]
+    assert len(wheel) == 0
+
+
+def test_timing_wheel_cancel():
+    wheel = TimingWheel(tick=0.01)
+    fired = []
+    timeout = wheel.schedule(0.05, fired.append, "x", now=10.0)
+
+    assert timeout.cancel()
+    assert not timeout.cancel()
+    assert wheel.advance(11.0) == 0
+    assert fired == []
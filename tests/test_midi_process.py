@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 MidiIOProcess tests against a fake rtmidi module in the spawned I/O process
+"""
+
+import json
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from src.handlers.midi_process import MidiIOProcess
+
+PORT = "Fake Launchpad"
+SYSEX = [0xF0, 0, 32, 41, 2, 13, 14, 1, 0xF7]
+
+FAKE_RTMIDI = textwrap.dedent('''
+    """Stand-in for python-rtmidi: records output and replays scripted input"""
+    import json
+    import os
+    import threading
+
+    PORTS = ["Fake Launchpad MIDI 1"]
+
+
+    class MidiOut:
+        def get_ports(self):
+            return PORTS
+
+        def open_port(self, index):
+            pass
+
+        def close_port(self):
+            pass
+
+        def send_message(self, message):
+            with open(os.environ["FAKE_RTMIDI_SENT"], "a") as f:
+                f.write(json.dumps(list(message)) + "\\n")
+
+
+    class MidiIn:
+        def get_ports(self):
+            return PORTS
+
+        def open_port(self, index):
+            pass
+
+        def close_port(self):
+            pass
+
+        def set_callback(self, callback):
+            incoming = json.loads(os.environ["FAKE_RTMIDI_INPUT"])
+            threading.Timer(
+                0.1, lambda: [callback((message, 0.0), None) for message in incoming]
+            ).start()
+
+        def cancel_callback(self):
+            pass
+''')
+
+
+@pytest.fixture
+def fake_rtmidi(tmp_path, monkeypatch):
+    """Put the fake module first on sys.path; spawned children inherit it"""
+    (tmp_path / "rtmidi.py").write_text(FAKE_RTMIDI)
+    sent = tmp_path / "sent.jsonl"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("FAKE_RTMIDI_SENT", str(sent))
+    monkeypatch.setenv("FAKE_RTMIDI_INPUT", json.dumps([[0x90, 11, 127], SYSEX, [0xF8]]))
+    monkeypatch.delitem(sys.modules, "rtmidi", raising=False)
+    return sent
+
+
+def test_messages_cross_the_process_unchanged(fake_rtmidi):
+    received = []
+    all_received = threading.Event()
+
+    def on_message(message, timestamp):
+        received.append(message)
+        if len(received) == 3:
+            all_received.set()
+
+    io = MidiIOProcess(PORT, on_message)
+    io.start()
+    try:
+        io.send_message([0x90, 11, 5])
+        io.send_message(SYSEX)
+        io.send_message([0xF8])
+        with pytest.raises(ValueError):
+            io.send_message([])
+        assert all_received.wait(10)
+    finally:
+        io.stop()
+
+    assert received == [[0x90, 11, 127], SYSEX, [0xF8]]
+    sent = [json.loads(line) for line in fake_rtmidi.read_text().splitlines()]
+    assert sent == [[0x90, 11, 5], SYSEX, [0xF8]]
+
+
+def test_missing_port_fails_to_start(fake_rtmidi):
+    io = MidiIOProcess("No Such Device", lambda message, timestamp: None)
+    with pytest.raises(ConnectionError):
+        io.start()
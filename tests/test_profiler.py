@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 RuntimeProfiler tests: action targets and profiling windows written to log_dir
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.profiler import RuntimeProfiler
+
+
+def wait_for_files(log_dir, pattern: str, timeout: float = 10.0) -> list:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        files = sorted(log_dir.glob(pattern))
+        if files:
+            return files
+        time.sleep(0.02)
+    return []
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.parametrize("target", ["", "disk", "cpu memory"])
+def test_handle_action_rejects_unknown_targets(tmp_path, target):
+    profiler = RuntimeProfiler(str(tmp_path))
+    with pytest.raises(ValueError):
+        profiler.handle_action(target)
+
+
+def test_cpu_window_writes_folded_profile(tmp_path):
+    profiler = RuntimeProfiler(str(tmp_path), window=0.3, interval=0.005)
+    stop = threading.Event()
+    parked = threading.Thread(target=stop.wait, name="parked", daemon=True)
+    busy = threading.Thread(target=busy_loop, args=(stop,), name="busy", daemon=True)
+    parked.start()
+    busy.start()
+    try:
+        assert profiler.handle_action(" cpu ")
+        files = wait_for_files(tmp_path, "cpu_profile_*.folded")
+    finally:
+        stop.set()
+
+    assert len(files) == 1
+    lines = files[0].read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+    # Stacks are rooted at the thread name, and parked threads are left out
+    roots = {line.split(";", 1)[0] for line in lines}
+    assert "busy" in roots
+    assert "parked" not in roots
+    assert "profiler-control" not in roots
+
+
+def test_cpu_toggle_ends_window_early(tmp_path):
+    profiler = RuntimeProfiler(str(tmp_path), window=60, interval=0.005)
+    profiler.toggle_cpu()
+    time.sleep(0.1)
+    profiler.toggle_cpu()
+    assert wait_for_files(tmp_path, "cpu_profile_*.folded", timeout=5)
+
+
+def test_memory_window_writes_snapshot(tmp_path):
+    profiler = RuntimeProfiler(str(tmp_path), window=0.2)
+    assert profiler.handle_action("memory")
+    files = wait_for_files(tmp_path, "memory_trace_*.snapshot")
+    assert len(files) == 1
+    assert files[0].stat().st_size > 0
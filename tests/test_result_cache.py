@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 ResultCache tests: TTL, single-flight, stale-while-revalidate and failures
+"""
+
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+
+import pytest
+
+from src.handlers.action_handler import ActionHandler, ActionResult
+from src.utils.result_cache import CachePolicy, ResultCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Counter:
+    def __init__(self, value=None):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return self.value if self.value is not None else self.calls
+
+
+def test_fresh_result_is_cached():
+    clock = FakeClock()
+    cache = ResultCache(clock)
+    func = Counter()
+    policy = CachePolicy(ttl=10)
+
+    assert cache.get_or_run(("a",), policy, func) == (1, False)
+    clock.now += 5
+    assert cache.get_or_run(("a",), policy, func) == (1, True)
+    assert func.calls == 1
+
+
+def test_expired_result_reruns():
+    clock = FakeClock()
+    cache = ResultCache(clock)
+    func = Counter()
+    policy = CachePolicy(ttl=10)
+
+    cache.get_or_run(("a",), policy, func)
+    clock.now += 11
+    assert cache.get_or_run(("a",), policy, func) == (2, False)
+
+
+def test_keys_are_independent():
+    cache = ResultCache(FakeClock())
+    func = Counter()
+    policy = CachePolicy(ttl=10)
+
+    assert cache.get_or_run(("a",), policy, func) == (1, False)
+    assert cache.get_or_run(("b",), policy, func) == (2, False)
+
+
+def test_invalidate():
+    cache = ResultCache(FakeClock())
+    func = Counter()
+    policy = CachePolicy(ttl=10)
+
+    cache.get_or_run(("a",), policy, func)
+    cache.invalidate(("a",))
+    assert cache.get_or_run(("a",), policy, func) == (2, False)
+
+
+def test_single_flight():
+    cache = ResultCache()
+    policy = CachePolicy(ttl=10)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "done"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_run(("a",), policy, slow)))
+    leader.start()
+    assert started.wait(2)
+
+    followers = [
+        threading.Thread(target=lambda: results.append(cache.get_or_run(("a",), policy, slow)))
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(2)
+
+    assert len(calls) == 1
+    assert sorted(results) == [("done", False)] + [("done", True)] * 3
+
+
+def test_stale_while_revalidate():
+    clock = FakeClock()
+    cache = ResultCache(clock)
+    policy = CachePolicy(ttl=10, stale_ttl=5)
+    refreshed = threading.Event()
+
+    def func():
+        refreshed.set()
+        return clock.now
+
+    assert cache.get_or_run(("a",), policy, func) == (100.0, False)
+    refreshed.clear()
+
+    clock.now = 112
+    assert cache.get_or_run(("a",), policy, func) == (100.0, True)
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.get_or_run(("a",), policy, func) == (112, True):
+            break
+        time.sleep(0.01)
+    assert cache.get_or_run(("a",), policy, func) == (112, True)
+
+
+def test_exceptions_are_not_cached():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+    calls = []
+
+    def boom():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            cache.get_or_run(("a",), policy, boom)
+    assert len(calls) == 2
+
+
+def test_rejected_results_are_not_cached():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+    func = Counter()
+
+    assert cache.get_or_run(("a",), policy, func, cacheable=lambda value: False) == (1, False)
+    assert cache.get_or_run(("a",), policy, func, cacheable=lambda value: False) == (2, False)
+
+
+def test_policy_key_tracks_env(monkeypatch):
+    policy = CachePolicy(ttl=10, env=("LAUNCHPAD_TEST_ENV",))
+    monkeypatch.setenv("LAUNCHPAD_TEST_ENV", "one")
+    first = policy.key("status")
+    monkeypatch.setenv("LAUNCHPAD_TEST_ENV", "two")
+    assert policy.key("status") != first
+
+
+def test_action_failures_not_cached_by_default():
+    handler = ActionHandler(plugin_dir=None)
+    outcomes = iter([False, True, False])
+    handler.register("flaky", lambda argument, deadline: ActionResult(next(outcomes), output="out"))
+    policy = CachePolicy(ttl=60)
+    try:
+        assert not handler.execute("flaky:x", cache=policy).success
+        second = handler.execute("flaky:x", cache=policy)
+        assert second.success and not second.cached
+        third = handler.execute("flaky:x", cache=policy)
+        assert third == ActionResult(True, output="out", cached=True)
+    finally:
+        handler.shutdown()
+
+
+def test_action_failures_cached_when_enabled():
+    handler = ActionHandler(plugin_dir=None)
+    calls = []
+    handler.register("fail", lambda argument, deadline: calls.append(1) or False)
+    policy = CachePolicy(ttl=60, cache_failures=True)
+    try:
+        handler.execute("fail:x", cache=policy)
+        assert handler.execute("fail:x", cache=policy).cached
+        assert len(calls) == 1
+    finally:
+        handler.shutdown()
+
+
+def test_get_or_submit_hit_does_not_submit():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+    cache.get_or_run(("a",), policy, lambda: "value")
+    submitted = []
+
+    future, cached = cache.get_or_submit(("a",), policy, Counter(), lambda *args: submitted.append(args))
+    assert future.done() and future.result() == "value"
+    assert cached and submitted == []
+
+
+def test_get_or_submit_joins_in_flight_run():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+    jobs = []
+
+    def submit(fn, *args):
+        jobs.append((fn, args))
+        return Future()
+
+    leader, leader_cached = cache.get_or_submit(("a",), policy, lambda: "value", submit)
+    follower, follower_cached = cache.get_or_submit(("a",), policy, lambda: "other", submit)
+    assert follower is leader
+    assert (leader_cached, follower_cached) == (False, True)
+    assert len(jobs) == 1 and not leader.done()
+
+    fn, args = jobs[0]
+    fn(*args)
+    assert leader.result(0) == "value"
+    assert cache.get_or_run(("a",), policy, Counter()) == ("value", True)
+
+
+def test_get_or_submit_cancelled_run_fails_waiters():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+    job = Future()
+
+    future, _ = cache.get_or_submit(("a",), policy, Counter(), lambda *args: job)
+    job.cancel()
+    with pytest.raises(CancelledError):
+        future.result(0)
+    # The key is free again for the next caller
+    assert cache.get_or_run(("a",), policy, Counter()) == (1, False)
+
+
+def test_get_or_submit_refused_run_frees_key():
+    cache = ResultCache(FakeClock())
+    policy = CachePolicy(ttl=10)
+
+    def refuse(*args):
+        raise RuntimeError("saturated")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_submit(("a",), policy, Counter(), refuse)
+    assert cache.get_or_run(("a",), policy, Counter()) == (1, False)
+
+
+def test_duplicate_presses_do_not_occupy_dispatch_workers():
+    handler = ActionHandler(plugin_dir=None, dispatch_workers=2, default_timeout=5)
+    release = threading.Event()
+    handler.register("slow", lambda argument, deadline: release.wait(5))
+    handler.register("fast", lambda argument, deadline: True)
+    policy = CachePolicy(ttl=60)
+    try:
+        presses = [handler.submit("slow:x", cache=policy) for _ in range(5)]
+        # Only the leader holds a dispatch worker, so the other one is still free
+        assert handler.submit("fast:y").result(timeout=1).success
+
+        release.set()
+        results = [press.result(timeout=5) for press in presses]
+        assert [result.cached for result in results] == [False, True, True, True, True]
+
+        callbacks = []
+        hit = handler.submit("slow:x", cache=policy, callback=callbacks.append)
+        assert hit.done() and hit.result().cached
+        assert callbacks == [hit.result()]
+    finally:
+        release.set()
+        handler.shutdown()
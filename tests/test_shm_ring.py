@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+🧪 SharedRing tests: ordering, wraparound, overflow and cross-process use
+"""
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from src.utils.shm_ring import SharedRing
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRing(capacity=4)
+    yield ring
+    ring.close()
+
+
+def _produce(name: str, wakeup, count: int):
+    """Child process: push ``count`` note-on messages into an existing ring"""
+    ring = SharedRing(name=name, wakeup=wakeup)
+    try:
+        for i in range(count):
+            while not ring.push(float(i), [0x90, i, 127]):
+                pass
+    finally:
+        ring.close()
+
+
+def test_push_pop_in_order(ring):
+    assert ring.pop() is None
+    assert ring.push(1.5, [0x90, 11, 127])
+    assert ring.push(2.5, [0x80, 11, 0])
+    assert ring.pop() == (1.5, [0x90, 11, 127])
+    assert ring.pop() == (2.5, [0x80, 11, 0])
+    assert ring.pop() is None
+
+
+def test_variable_length_messages_round_trip(ring):
+    sysex = [0xF0, 0, 32, 41, 2, 13, 14, 1, 0xF7]
+    assert ring.push(1.0, [0xF8])
+    assert ring.push(2.0, [0xB0, 91])
+    assert ring.push(3.0, sysex)
+    assert ring.drain() == [(1.0, [0xF8]), (2.0, [0xB0, 91]), (3.0, sysex)]
+
+
+def test_unrepresentable_messages_raise(ring):
+    with pytest.raises(ValueError):
+        ring.push(1.0, [])
+    with pytest.raises(ValueError):
+        ring.push(1.0, [0x90, 300, 0])
+    with pytest.raises(ValueError):
+        ring.push(1.0, [0xF0] + [0] * ring.max_message)
+    assert ring.pop() is None
+
+
+def test_max_length_message_fits():
+    ring = SharedRing(capacity=2, max_message=20)
+    try:
+        message = [0xF0] + list(range(18)) + [0xF7]
+        assert ring.push(1.0, message)
+        assert ring.push(2.0, [0xF8])
+        assert ring.drain() == [(1.0, message), (2.0, [0xF8])]
+    finally:
+        ring.close()
+
+
+def test_full_ring_drops(ring):
+    for i in range(4):
+        assert ring.push(float(i), [0x90, i, 1])
+    assert not ring.push(4.0, [0x90, 4, 1])
+    assert ring.dropped == 1
+    assert [ts for ts, _ in ring.drain()] == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_drain_limit_and_wraparound(ring):
+    for round_start in range(0, 12, 3):
+        for i in range(round_start, round_start + 3):
+            assert ring.push(float(i), [0x90, i, 1])
+        assert ring.drain(limit=2) == [
+            (float(round_start), [0x90, round_start, 1]),
+            (float(round_start + 1), [0x90, round_start + 1, 1]),
+        ]
+        assert ring.drain() == [(float(round_start + 2), [0x90, round_start + 2, 1])]
+    assert ring.drain() == []
+
+
+def test_attach_by_name_shares_data_and_capacity(ring):
+    other = SharedRing(name=ring.name)
+    try:
+        assert other.capacity == ring.capacity == 4
+        assert other.max_message == ring.max_message
+        ring.push(3.0, [0x90, 1, 2])
+        assert other.pop() == (3.0, [0x90, 1, 2])
+        assert ring.pop() is None
+    finally:
+        other.close()
+
+
+def test_wait_times_out_when_idle():
+    ring = SharedRing(capacity=4, wakeup=threading.Semaphore(0))
+    try:
+        started = time.monotonic()
+        assert not ring.wait(0.05)
+        assert time.monotonic() - started >= 0.04
+    finally:
+        ring.close()
+
+
+def test_push_wakes_blocked_consumer():
+    ring = SharedRing(capacity=4, wakeup=threading.Semaphore(0))
+    received = []
+
+    def consume():
+        while not received:
+            received.extend(ring.drain())
+            if not received:
+                ring.wait(5)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    try:
+        time.sleep(0.05)
+        started = time.monotonic()
+        ring.push(1.0, [0x90, 1, 1])
+        consumer.join(5)
+        assert time.monotonic() - started < 1
+        assert received == [(1.0, [0x90, 1, 1])]
+    finally:
+        ring.close()
+
+
+def test_only_empty_to_non_empty_push_signals():
+    ring = SharedRing(capacity=4, wakeup=threading.Semaphore(0))
+    try:
+        ring.push(1.0, [1])
+        ring.push(2.0, [2])
+        assert ring.wait(0)
+        assert not ring.wait(0)
+        ring.drain()
+        ring.push(3.0, [3])
+        assert ring.wait(0)
+    finally:
+        ring.close()
+
+
+def test_notify_wakes_consumer():
+    ring = SharedRing(capacity=4, wakeup=threading.Semaphore(0))
+    try:
+        ring.notify()
+        assert ring.wait(0)
+    finally:
+        ring.close()
+
+
+def test_cross_process_producer():
+    context = multiprocessing.get_context("spawn")
+    ring = SharedRing(capacity=16, wakeup=context.Semaphore(0))
+    try:
+        process = context.Process(target=_produce, args=(ring.name, ring.wakeup, 100))
+        process.start()
+
+        received = []
+        deadline = time.monotonic() + 10
+        while len(received) < 100 and time.monotonic() < deadline:
+            batch = ring.drain()
+            received.extend(batch)
+            if not batch:
+                ring.wait(0.1)
+
+        process.join(10)
+        assert process.exitcode == 0
+        assert [message[1] for _, message in received] == list(range(100))
+    finally:
+        ring.close()